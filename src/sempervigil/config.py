@@ -5,7 +5,7 @@ import os
 from dataclasses import dataclass
 from typing import Any
 
-from .storage import get_setting, set_setting
+from .storage import get_setting, get_setting_raw, set_setting
 
 
 class ConfigError(ValueError):
@@ -397,9 +397,19 @@ def validate_events_settings(cfg: dict[str, Any]) -> list[str]:
             errors.append(f"events.settings.{key} must be an integer")
     return errors
 
+# Last built Config keyed by the stored JSON text. Workers reload the config
+# for every job, and the stored value rarely changes between jobs.
+_LOADED_RUNTIME_CONFIG: dict[str, Config] = {}
+
+
 def load_runtime_config(conn) -> Config:
-    cfg = get_runtime_config(conn)
-    config = _build_config(cfg)
+    raw = get_setting_raw(conn, CONFIG_KEY)
+    config = _LOADED_RUNTIME_CONFIG.get(raw) if raw is not None else None
+    if config is None:
+        config = _build_config(get_runtime_config(conn))
+        if raw is not None:
+            _LOADED_RUNTIME_CONFIG.clear()
+            _LOADED_RUNTIME_CONFIG[raw] = config
     return _apply_hugo_path_overrides(config)
 
 
@@ -127,10 +127,14 @@ def _collect_cpes(
 ) -> None:
     for match in node.get("cpeMatch") or []:
         cpe = match.get("criteria") or match.get("cpe23Uri")
-        if not cpe:
+        # NVD repeats the same criteria across nodes; a CPE already seen adds
+        # nothing new to any of the sets.
+        if not cpe or cpe in cpes:
             continue
         cpes.add(cpe)
-        parts = cpe.split(":")
+        # Only part, vendor, product and version are read, so stop splitting
+        # after the version field.
+        parts = cpe.split(":", 6)
         if len(parts) >= 5:
             vendors.add(parts[3])
             products.add(parts[4])
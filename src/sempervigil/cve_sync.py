@@ -4,7 +4,8 @@ import hashlib
 import logging
 import json
 import time
-from dataclasses import asdict, dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 from urllib.error import HTTPError, URLError
@@ -52,44 +53,54 @@ def sync_cves(
     errors = 0
     filtered = 0
 
-    while True:
-        payload = _fetch_page(
+    def _fetch(start: int, delay: float) -> dict[str, Any] | None:
+        if delay:
+            time.sleep(delay)
+        return _fetch_page(
             config,
             last_modified_start=last_modified_start,
             last_modified_end=last_modified_end,
-            start_index=start_index,
+            start_index=start,
             cve_id=cve_id,
         )
-        if payload is None:
-            errors += 1
-            break
-        vulnerabilities = payload.get("vulnerabilities") or []
-        if not vulnerabilities:
-            break
-        for item in vulnerabilities:
-            cve_item = item.get("cve") or {}
-            processed = process_cve_item(
-                conn,
-                cve_item,
-                config.prefer_v4,
-                config.filters or {},
-                config.scope_min_cvss,
-                config.watchlist_enabled,
-                logger,
-            )
-            if processed is None:
-                filtered += 1
-                continue
-            total_processed += 1
-            total_new += 1 if processed.new_snapshot else 0
-            total_changes += processed.change_count
 
-        start_index += int(payload.get("resultsPerPage", config.results_per_page))
-        if cve_id:
-            break
-        if start_index >= int(payload.get("totalResults", 0)):
-            break
-        time.sleep(config.rate_limit_seconds)
+    # The next page is requested on a background thread while the current
+    # one is written to the database, so NVD latency overlaps with our own
+    # work. At most one request is in flight, and the rate-limit delay still
+    # runs before each follow-up request.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        payload = _fetch(start_index, 0.0)
+        while True:
+            if payload is None:
+                errors += 1
+                break
+            vulnerabilities = payload.get("vulnerabilities") or []
+            if not vulnerabilities:
+                break
+            start_index += int(payload.get("resultsPerPage", config.results_per_page))
+            next_page = None
+            if not cve_id and start_index < int(payload.get("totalResults", 0)):
+                next_page = executor.submit(_fetch, start_index, config.rate_limit_seconds)
+            for item in vulnerabilities:
+                cve_item = item.get("cve") or {}
+                processed = process_cve_item(
+                    conn,
+                    cve_item,
+                    config.prefer_v4,
+                    config.filters or {},
+                    config.scope_min_cvss,
+                    config.watchlist_enabled,
+                    logger,
+                )
+                if processed is None:
+                    filtered += 1
+                    continue
+                total_processed += 1
+                total_new += 1 if processed.new_snapshot else 0
+                total_changes += processed.change_count
+            if next_page is None:
+                break
+            payload = next_page.result()
 
     if errors == 0:
         set_setting(conn, "cve.last_successful_sync_at", utc_now_iso())
@@ -155,7 +166,7 @@ def process_cve_item(
         filters=filters,
     ):
         return None
-    preferred_dict = asdict(preferred)
+    preferred_dict = _metrics_dict(preferred)
     snapshot_hash = _snapshot_hash(
         {
             "preferred": preferred_dict,
@@ -195,6 +206,10 @@ def process_cve_item(
     )
     if watchlist_enabled:
         compute_scope_for_cves(conn, [cve_id], min_cvss=scope_min_cvss)
+    if prev_snapshot and prev_snapshot.get("snapshot_hash") == snapshot_hash:
+        # Same metrics and lastModified as the latest snapshot: nothing new to
+        # snapshot or diff, but the CVE row and links above are still refreshed.
+        return ProcessResult(new_snapshot=False, change_count=0)
     observed_at = utc_now_iso()
     inserted = insert_cve_snapshot(
         conn,
@@ -236,6 +251,17 @@ class PreferredMetrics:
     vector: str | None
 
 
+def _metrics_dict(metrics: PreferredMetrics) -> dict[str, Any]:
+    # Same result as dataclasses.asdict for this flat dataclass, without its
+    # recursive field walk and per-value deepcopy.
+    return {
+        "version": metrics.version,
+        "base_score": metrics.base_score,
+        "base_severity": metrics.base_severity,
+        "vector": metrics.vector,
+    }
+
+
 def _select_preferred_metrics(
     v31_list: list[dict[str, Any]],
     v40_list: list[dict[str, Any]],
@@ -6,6 +6,11 @@ from typing import Any
 from .migrations_pg import apply_migrations_pg
 
 _MIGRATIONS_APPLIED = {"postgres": False}
+# psycopg prepares a query server-side once it has run prepare_threshold
+# times on a connection, keeping at most prepared_max of them (default 100).
+# storage issues far more distinct statements than that, so a long-lived
+# connection kept evicting and re-preparing its hot queries.
+_PREPARED_MAX = 256
 
 
 def get_db_url() -> str:
@@ -56,6 +61,7 @@ def connect_db() -> DBConn:
     except ImportError as exc:  # pragma: no cover - depends on env
         raise RuntimeError("psycopg is required for PostgreSQL support") from exc
     raw = psycopg.connect(url)
+    raw.prepared_max = _PREPARED_MAX
     conn = DBConn(raw, "postgres")
     if not _MIGRATIONS_APPLIED["postgres"]:
         apply_migrations_pg(conn)
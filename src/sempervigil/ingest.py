@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import json
 import logging
+import re
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 from urllib.error import HTTPError, URLError
 from urllib.parse import urljoin, urlparse
@@ -71,9 +73,26 @@ def _entry_summary(entry: Any, prefer_entry_summary: bool) -> str | None:
     return entry.get("description") or entry.get("summary")
 
 
+@lru_cache(maxsize=32)
+def _keyword_pattern(keywords: tuple[str, ...]) -> tuple[re.Pattern[str], tuple[str, ...]]:
+    lowered = tuple(keyword.lower() for keyword in keywords)
+    return re.compile("|".join(map(re.escape, lowered))), lowered
+
+
 def _keyword_match(text: str, keywords: list[str]) -> list[str]:
+    if not keywords:
+        return []
+    pattern, lowered_keywords = _keyword_pattern(tuple(keywords))
     lowered = text.lower()
-    return [keyword for keyword in keywords if keyword.lower() in lowered]
+    # One scan rejects the common no-match case; overlapping keywords
+    # ("ransom", "ransomware") still each need their own check.
+    if pattern.search(lowered) is None:
+        return []
+    return [
+        keyword
+        for keyword, needle in zip(keywords, lowered_keywords)
+        if needle in lowered
+    ]
 
 
 def evaluate_entry(
@@ -5,6 +5,34 @@ import logging
 from .utils import utc_now_iso
 
 
+_BOOTSTRAP_INDEX_DDL = ";\n".join(
+    [
+        "CREATE INDEX IF NOT EXISTS idx_jobs_status_requested ON jobs(status, requested_at)",
+        "CREATE INDEX IF NOT EXISTS idx_jobs_locked ON jobs(locked_by, locked_at)",
+        "CREATE INDEX IF NOT EXISTS idx_health_alerts_source ON health_alerts(source_id, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_cves_last_modified ON cves(last_modified_at DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_cve_snapshots_cve ON cve_snapshots(cve_id, observed_at DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_cve_changes_cve ON cve_changes(cve_id, change_at DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_llm_models_provider ON llm_models(provider_id)",
+        "CREATE INDEX IF NOT EXISTS idx_llm_profiles_provider ON llm_profiles(primary_provider_id)",
+        "CREATE INDEX IF NOT EXISTS idx_articles_source_published ON articles(source_id, published_at DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_articles_brief_day ON articles(brief_day)",
+        "CREATE INDEX IF NOT EXISTS idx_source_health_source_ts ON source_health_history(source_id, ts DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_vendors_name ON vendors(name_norm)",
+        "CREATE INDEX IF NOT EXISTS idx_products_key ON products(product_key)",
+        "CREATE INDEX IF NOT EXISTS idx_products_name ON products(name_norm)",
+        "CREATE INDEX IF NOT EXISTS idx_products_vendor ON products(vendor_id)",
+        "CREATE INDEX IF NOT EXISTS idx_cve_products_product ON cve_products(product_id)",
+        "CREATE INDEX IF NOT EXISTS idx_cve_products_cve ON cve_products(cve_id)",
+        "CREATE INDEX IF NOT EXISTS idx_events_kind ON events(kind)",
+        "CREATE INDEX IF NOT EXISTS idx_events_last_seen ON events(last_seen_at)",
+        "CREATE INDEX IF NOT EXISTS idx_events_severity ON events(severity)",
+        "CREATE INDEX IF NOT EXISTS idx_event_items_type_key ON event_items(item_type, item_key)",
+        "CREATE INDEX IF NOT EXISTS idx_event_items_event ON event_items(event_id)",
+    ]
+)
+
+
 def apply_migrations_pg(conn) -> None:
     logger = logging.getLogger("sempervigil.migrations")
     conn.execute("BEGIN")
@@ -609,28 +637,8 @@ def _bootstrap_schema(conn) -> None:
         )
         """
     )
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status_requested ON jobs(status, requested_at)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_locked ON jobs(locked_by, locked_at)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_health_alerts_source ON health_alerts(source_id, created_at)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_cves_last_modified ON cves(last_modified_at DESC)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_cve_snapshots_cve ON cve_snapshots(cve_id, observed_at DESC)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_cve_changes_cve ON cve_changes(cve_id, change_at DESC)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_models_provider ON llm_models(provider_id)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_profiles_provider ON llm_profiles(primary_provider_id)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_source_published ON articles(source_id, published_at DESC)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_brief_day ON articles(brief_day)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_source_health_source_ts ON source_health_history(source_id, ts DESC)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_vendors_name ON vendors(name_norm)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_products_key ON products(product_key)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_products_name ON products(name_norm)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_products_vendor ON products(vendor_id)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_cve_products_product ON cve_products(product_id)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_cve_products_cve ON cve_products(cve_id)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_events_kind ON events(kind)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_events_last_seen ON events(last_seen_at)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_events_severity ON events(severity)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_event_items_type_key ON event_items(item_type, item_key)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_event_items_event ON event_items(event_id)")
+    # One round trip for every bootstrap index instead of one per statement.
+    conn.execute(_BOOTSTRAP_INDEX_DDL)
 
 
 def _migrate_events_v2(conn) -> None:
@@ -10,6 +10,14 @@ import yaml
 from .models import Article
 from .utils import slugify
 
+# libyaml's emitter is roughly 10x faster than PyYAML's pure-Python one; fall
+# back when PyYAML was built without it.
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _dump_yaml(data: dict[str, object], **kwargs: object) -> str:
+    return yaml.dump(data, Dumper=_YAML_DUMPER, **kwargs)
+
 
 def _safe_filename(article: Article) -> str:
     date_part = (article.published_at or article.ingested_at).split("T")[0]
@@ -44,7 +52,7 @@ def write_article_markdown(
         ]
     )
     content = "---\n"
-    content += yaml.safe_dump(
+    content += _dump_yaml(
         frontmatter, sort_keys=False, allow_unicode=False, default_flow_style=False
     )
     content += "---\n\n"
@@ -104,7 +112,7 @@ def write_tag_indexes(articles: Iterable[Article], output_dir: str, section: str
         path = tag_dir / "_index.md"
         frontmatter = {"title": f"Tag: {tag}"}
         lines = ["---"]
-        lines.append(yaml.safe_dump(frontmatter, sort_keys=False, allow_unicode=False).strip())
+        lines.append(_dump_yaml(frontmatter, sort_keys=False, allow_unicode=False).strip())
         lines.append("---")
         lines.append("")
 
@@ -185,7 +193,7 @@ def write_events_markdown(
         products = items.get("products") or []
         articles = items.get("articles") or []
         lines = ["---"]
-        lines.append(yaml.safe_dump(frontmatter, sort_keys=False, allow_unicode=False).strip())
+        lines.append(_dump_yaml(frontmatter, sort_keys=False, allow_unicode=False).strip())
         lines.append("---")
         lines.append("")
         if summary:
@@ -206,7 +206,29 @@ def get_article_id(conn: Any, source_id: str, stable_id: str) -> int | None:
     return _get_article_id(conn, source_id, stable_id)
 
 
+def get_article_ids(
+    conn: Any, keys: Iterable[tuple[str, str]]
+) -> dict[tuple[str, str], int]:
+    pairs = list(dict.fromkeys(keys))
+    if not pairs:
+        return {}
+    placeholders = ", ".join(["(%s, %s)"] * len(pairs))
+    params: list[object] = []
+    for source_id, stable_id in pairs:
+        params.extend([source_id, stable_id])
+    cursor = conn.execute(
+        f"""
+        SELECT source_id, stable_id, id
+        FROM articles
+        WHERE (source_id, stable_id) IN ({placeholders})
+        """,
+        tuple(params),
+    )
+    return {(row[0], row[1]): row[2] for row in cursor.fetchall()}
+
+
 def insert_articles(conn: Any, articles: Iterable[Article]) -> int:
+    articles = list(articles)
     rows = [
         (
             article.source_id,
@@ -246,11 +268,18 @@ def insert_articles(conn: Any, articles: Iterable[Article]) -> int:
     )
     conn.commit()
 
-    for article in articles:
-        article_id = _get_article_id(conn, article.source_id, article.stable_id)
-        if article_id is None:
-            continue
-        _insert_article_tags(conn, article_id, article.tags)
+    tagged = [article for article in articles if article.tags]
+    article_ids = get_article_ids(
+        conn, [(article.source_id, article.stable_id) for article in tagged]
+    )
+    _insert_article_tags(
+        conn,
+        [
+            (article_ids[(article.source_id, article.stable_id)], article.tags)
+            for article in tagged
+            if (article.source_id, article.stable_id) in article_ids
+        ],
+    )
 
     return len(rows)
 
@@ -319,63 +348,90 @@ def upsert_cve_links(
     cve_ids: list[str],
     evidence: dict[str, object],
 ) -> None:
-    if not cve_ids:
+    upsert_cve_links_many(conn, [(article_id, cve_ids, evidence)])
+
+
+_ARTICLE_CVE_COLUMNS = (
+    "article_id",
+    "cve_id",
+    "confidence",
+    "confidence_band",
+    "reasons_json",
+    "evidence_json",
+    "created_at",
+    "matched_by",
+    "inference_level",
+)
+
+
+def upsert_cve_links_many(
+    conn: Any,
+    links: Iterable[tuple[int, list[str], dict[str, object]]],
+) -> None:
+    links = [(article_id, cve_ids, evidence) for article_id, cve_ids, evidence in links if cve_ids]
+    if not links:
         return
     now = utc_now_iso()
+    all_cve_ids = sorted({cve_id for _, cve_ids, _ in links for cve_id in cve_ids})
     if _table_exists(conn, "cves"):
         cve_columns = _table_columns(conn, "cves")
-        for cve_id in cve_ids:
-            if "created_at" in cve_columns and "last_seen_at" in cve_columns:
-                conn.execute(
-                    """
-                    INSERT INTO cves (cve_id, created_at, last_seen_at)
-                    VALUES (%s, %s, %s)
-                    ON CONFLICT(cve_id) DO UPDATE SET last_seen_at = excluded.last_seen_at
-                    """,
-                    (cve_id, now, now),
-                )
-            elif "updated_at" in cve_columns:
-                conn.execute(
-                    """
-                    INSERT INTO cves (cve_id, updated_at)
-                    VALUES (%s, %s)
-                    ON CONFLICT(cve_id) DO UPDATE SET updated_at = excluded.updated_at
-                    """,
-                    (cve_id, now),
-                )
-            else:
-                conn.execute(
-                    "INSERT INTO cves (cve_id) VALUES (%s) ON CONFLICT DO NOTHING",
-                    (cve_id,),
-                )
-    if _table_exists(conn, "article_cves"):
-        columns = _table_columns(conn, "article_cves")
-        for cve_id in cve_ids:
-            payload = {
-                "article_id": article_id,
-                "cve_id": cve_id,
-                "confidence": 1.0,
-                "confidence_band": "linked",
-                "reasons_json": json_dumps(["rule.cve.explicit"]),
-                "evidence_json": json_dumps(evidence),
-                "created_at": now,
-                "matched_by": "explicit",
-                "inference_level": "explicit",
-            }
-            cols = [key for key in payload if key in columns]
-            values = [payload[col] for col in cols]
-            placeholders = ", ".join("%s" for _ in cols)
-            conn.execute(
-                f"""
-                INSERT INTO article_cves ({", ".join(cols)})
-                VALUES ({placeholders})
-                ON CONFLICT DO NOTHING
+        if "created_at" in cve_columns and "last_seen_at" in cve_columns:
+            conn.executemany(
+                """
+                INSERT INTO cves (cve_id, created_at, last_seen_at)
+                VALUES (%s, %s, %s)
+                ON CONFLICT(cve_id) DO UPDATE SET last_seen_at = excluded.last_seen_at
+                """,
+                [(cve_id, now, now) for cve_id in all_cve_ids],
+            )
+        elif "updated_at" in cve_columns:
+            conn.executemany(
+                """
+                INSERT INTO cves (cve_id, updated_at)
+                VALUES (%s, %s)
+                ON CONFLICT(cve_id) DO UPDATE SET updated_at = excluded.updated_at
                 """,
-                values,
+                [(cve_id, now) for cve_id in all_cve_ids],
             )
+        else:
+            conn.executemany(
+                "INSERT INTO cves (cve_id) VALUES (%s) ON CONFLICT DO NOTHING",
+                [(cve_id,) for cve_id in all_cve_ids],
+            )
+    if _table_exists(conn, "article_cves"):
+        columns = _table_columns(conn, "article_cves")
+        cols = [col for col in _ARTICLE_CVE_COLUMNS if col in columns]
+        # Every explicit link shares the same reasons, so serialize them once.
+        reasons_json = json_dumps(["rule.cve.explicit"])
+        rows: list[list[object]] = []
+        for article_id, cve_ids, evidence in links:
+            evidence_json = json_dumps(evidence)
+            for cve_id in cve_ids:
+                payload = {
+                    "article_id": article_id,
+                    "cve_id": cve_id,
+                    "confidence": 1.0,
+                    "confidence_band": "linked",
+                    "reasons_json": reasons_json,
+                    "evidence_json": evidence_json,
+                    "created_at": now,
+                    "matched_by": "explicit",
+                    "inference_level": "explicit",
+                }
+                rows.append([payload[col] for col in cols])
+        placeholders = ", ".join("%s" for _ in cols)
+        conn.executemany(
+            f"""
+            INSERT INTO article_cves ({", ".join(cols)})
+            VALUES ({placeholders})
+            ON CONFLICT DO NOTHING
+            """,
+            rows,
+        )
         conn.commit()
         return
-    _append_article_cves_meta(conn, article_id, cve_ids, evidence)
+    for article_id, cve_ids, evidence in links:
+        _append_article_cves_meta(conn, article_id, cve_ids, evidence)
 
 
 def _append_article_cves_meta(
@@ -422,6 +478,12 @@ def get_setting(conn: Any, key: str, default: object) -> object:
         return default
 
 
+def get_setting_raw(conn: Any, key: str) -> str | None:
+    cursor = conn.execute("SELECT value FROM settings WHERE key = %s", (key,))
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
 def set_setting(conn: Any, key: str, value: object) -> None:
     payload = json_dumps(value)
     now = utc_now_iso()
@@ -617,7 +679,8 @@ def get_latest_cve_snapshot(conn: Any, cve_id: str) -> dict[str, object] | None:
     cursor = conn.execute(
         """
         SELECT preferred_cvss_version, preferred_base_score, preferred_base_severity,
-               preferred_vector, cvss_v40_json, cvss_v31_json, nvd_last_modified_at
+               preferred_vector, cvss_v40_json, cvss_v31_json, nvd_last_modified_at,
+               snapshot_hash
         FROM cve_snapshots
         WHERE cve_id = %s
         ORDER BY observed_at DESC
@@ -638,6 +701,7 @@ def get_latest_cve_snapshot(conn: Any, cve_id: str) -> dict[str, object] | None:
         "cvss_v40_json": cvss_v40,
         "cvss_v31_json": cvss_v31,
         "nvd_last_modified_at": row[6],
+        "snapshot_hash": row[7],
     }
 
 
@@ -841,6 +905,57 @@ def enqueue_job(
     return job_id
 
 
+def enqueue_jobs_bulk(
+    conn: Any, jobs: Iterable[tuple[str, dict[str, object] | None]]
+) -> list[str]:
+    now = utc_now_iso()
+    rows = [
+        (_new_job_id(), job_type, "queued", json_dumps(payload) if payload else None, now)
+        for job_type, payload in jobs
+    ]
+    if not rows:
+        return []
+    conn.executemany(
+        """
+        INSERT INTO jobs (id, job_type, status, payload_json, requested_at)
+        VALUES (%s, %s, %s, %s, %s)
+        """,
+        rows,
+    )
+    conn.commit()
+    return [row[0] for row in rows]
+
+
+def enqueue_source_jobs(conn: Any, job_type: str, source_ids: Iterable[str]) -> list[str]:
+    ids = list(dict.fromkeys(source_ids))
+    if not ids:
+        return []
+    now = utc_now_iso()
+    params: list[object] = [job_type, now]
+    for source_id in ids:
+        params.extend([_new_job_id(), source_id, json_dumps({"source_id": source_id})])
+    params.append(job_type)
+    placeholders = ", ".join(["(%s, %s, %s)"] * len(ids))
+    cursor = conn.execute(
+        f"""
+        INSERT INTO jobs (id, job_type, status, payload_json, requested_at)
+        SELECT v.id, %s, 'queued', v.payload_json, %s
+        FROM (VALUES {placeholders}) AS v(id, source_id, payload_json)
+        WHERE NOT EXISTS (
+            SELECT 1 FROM jobs j
+            WHERE j.job_type = %s
+              AND j.status = 'queued'
+              AND j.payload_json::jsonb ->> 'source_id' = v.source_id
+        )
+        RETURNING payload_json::jsonb ->> 'source_id'
+        """,
+        tuple(params),
+    )
+    inserted = {row[0] for row in cursor.fetchall()}
+    conn.commit()
+    return [source_id for source_id in ids if source_id in inserted]
+
+
 def list_jobs(conn: Any, limit: int = 50) -> list[Job]:
     cursor = conn.execute(
         """
@@ -1618,12 +1733,13 @@ def claim_next_job(
                     """,
                     (cutoff,),
                 )
+            # ANY(%s) keeps the statement text the same for every allowed_types
+            # list, so psycopg's prepared-statement cache reuses one plan.
             params: list[object] = []
             type_clause = ""
             if allowed_types:
-                placeholders = ",".join(["%s"] * len(allowed_types))
-                type_clause = f" AND job_type IN ({placeholders})"
-                params.extend(allowed_types)
+                type_clause = " AND job_type = ANY(%s)"
+                params.append(list(allowed_types))
             cursor = conn.execute(
                 f"""
                 SELECT id, job_type, status, payload_json, result_json, requested_at, started_at,
@@ -5029,10 +5145,10 @@ def update_article_summary(
     conn.commit()
 
 
-def _insert_article_tags(conn: Any, article_id: int, tags: list[str]) -> None:
-    if not tags:
+def _insert_article_tags(conn: Any, tagged: list[tuple[int, list[str]]]) -> None:
+    rows = [(article_id, tag, None) for article_id, tags in tagged for tag in tags]
+    if not rows:
         return
-    rows = [(article_id, tag, None) for tag in tags]
     conn.executemany(
         """
         INSERT INTO article_tags (article_id, tag, tag_type)
@@ -5089,6 +5205,9 @@ def _last_run_map(conn: Any) -> dict[str, str]:
 
 
 def _parse_iso(value: str) -> datetime:
-    if value.endswith("Z"):
-        value = value.replace("Z", "+00:00")
-    return datetime.fromisoformat(value).astimezone(timezone.utc)
+    # fromisoformat accepts a trailing "Z" on 3.11+, and stored timestamps are
+    # already UTC, so only convert when the offset actually differs.
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is timezone.utc:
+        return parsed
+    return parsed.astimezone(timezone.utc)
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Iterable
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_INVALID_TAG_CHARS_RE = re.compile(r"[^a-z0-9\-]")
+_DASH_RUN_RE = re.compile(r"-+")
+
+
+# Every entry re-normalizes the same policy defaults, aliases and rule tags,
+# so the set of distinct inputs stays small.
+@lru_cache(maxsize=1024)
 def normalize_tag(tag: str) -> str:
     cleaned = tag.strip().lower()
-    cleaned = re.sub(r"\s+", "-", cleaned)
-    cleaned = re.sub(r"[^a-z0-9\-]", "-", cleaned)
-    cleaned = re.sub(r"-+", "-", cleaned).strip("-")
+    cleaned = _WHITESPACE_RE.sub("-", cleaned)
+    cleaned = _INVALID_TAG_CHARS_RE.sub("-", cleaned)
+    cleaned = _DASH_RUN_RE.sub("-", cleaned).strip("-")
     return cleaned
 
 
@@ -11,6 +11,7 @@ import re
 import unicodedata
 from datetime import date, datetime, timezone, timedelta
 from enum import Enum
+from functools import lru_cache
 from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Any
@@ -19,6 +20,8 @@ from uuid import UUID
 
 
 def log_event(logger: logging.Logger, level: int, event: str, **fields: Any) -> None:
+    if not logger.isEnabledFor(level):
+        return
     parts = [f"event={event}"]
     hide_source_id = bool(fields.get("source_name"))
     for key, value in fields.items():
@@ -70,7 +73,10 @@ def _maybe_add_file_handler(level_name: str) -> None:
 def _ensure_stdout_handler(level_name: str) -> None:
     root = logging.getLogger()
     for handler in list(root.handlers):
-        if isinstance(handler, logging.StreamHandler):
+        # FileHandler subclasses StreamHandler; SV_LOG_FILE's handler is not ours to drop.
+        if isinstance(handler, logging.StreamHandler) and not isinstance(
+            handler, logging.FileHandler
+        ):
             if handler.stream is sys.stdout:
                 return
             root.removeHandler(handler)
@@ -81,7 +87,7 @@ def _ensure_stdout_handler(level_name: str) -> None:
 
 
 def json_dumps(value: Any) -> str:
-    return json.dumps(value, default=_json_default, sort_keys=True)
+    return _JSON_ENCODER.encode(value)
 
 
 def _json_default(value: Any) -> Any:
@@ -107,6 +113,11 @@ def _json_default(value: Any) -> Any:
     return str(value)
 
 
+# json.dumps builds a fresh JSONEncoder on every call once default= is passed;
+# job payloads are encoded on every enqueue, so share a single instance.
+_JSON_ENCODER = json.JSONEncoder(default=_json_default, sort_keys=True)
+
+
 def normalize_url(url: str, strip_tracking_params: bool, tracking_params: list[str]) -> str:
     if not url:
         return url
@@ -127,6 +138,9 @@ def normalize_url(url: str, strip_tracking_params: bool, tracking_params: list[s
     return normalized
 
 
+# Feeds are re-polled on a schedule, so a long-running worker sees the same
+# entry URLs over and over.
+@lru_cache(maxsize=4096)
 def stable_id_from_url(url: str) -> str:
     return hashlib.sha256(url.encode("utf-8")).hexdigest()
 
@@ -6,9 +6,12 @@ import logging
 import os
 import time
 import uuid
+import weakref
+from collections.abc import Callable
 from dataclasses import replace
 from datetime import datetime, timezone, timedelta
 from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.error import HTTPError, URLError
 from urllib.parse import urlparse
 
 from .config import (
@@ -20,11 +23,11 @@ from .config import (
     load_runtime_config,
 )
 from .ingest import process_source
-from .models import Article, Job
+from .models import Article, Job, Source
 from .cve_sync import CveSyncConfig, isoformat_utc, sync_cves
 from .fsinit import build_default_paths, ensure_runtime_dirs, set_umask_from_env
 from .publish import write_article_markdown, write_events_index, write_events_markdown, write_json_index
-from .signals import build_cve_evidence, extract_cve_ids
+from .signals import build_cve_evidence, extract_cve_ids_by_article
 from .pipelines.content_fetch import fetch_article_content
 from .pipelines.daily_brief import write_daily_brief
 from .llm.router import run_profile
@@ -37,13 +40,15 @@ from .storage import (
     claim_next_job,
     complete_job,
     enqueue_job,
+    enqueue_jobs_bulk,
+    enqueue_source_jobs,
     enqueue_build_site_if_needed,
     fail_job,
-    get_source,
     list_sources,
     get_setting,
+    get_source,
     set_setting,
-    get_article_id,
+    get_article_ids,
     get_article_by_id,
     get_article_tags,
     get_event,
@@ -66,7 +71,7 @@ from .storage import (
     record_health_alert,
     record_source_run,
     rebuild_events_from_cves,
-    upsert_cve_links,
+    upsert_cve_links_many,
     upsert_event_by_key,
     upsert_event_item,
     list_product_keys_for_cve,
@@ -75,7 +80,6 @@ from .storage import (
     list_article_ids_without_event,
     link_event_article,
     get_source_run_streaks,
-    get_source_name,
     insert_source_health_event,
     update_article_content,
     update_article_summary,
@@ -94,29 +98,84 @@ from .storage import (
 )
 from .utils import configure_logging, log_event, utc_now_iso, utc_now_iso_offset
 
-WORKER_JOB_TYPES = [
-    "ingest_source",
-    "ingest_due_sources",
-    "test_source",
-    "cve_sync",
-    "events_rebuild",
-    "fetch_article_content",
-    "summarize_article_llm",
-    "build_daily_brief",
-    "write_article_markdown",
-    "derive_events_from_articles",
-    "enrich_event_from_web",
-    "promote_event_web_source_to_article",
-    "enrich_event_summary_llm",
-    "source_acquire",
-    "smoke_test",
-]
+# Job dispatch table, keyed by job_type. Every entry takes
+# (conn, config, job, logger, now) so run_claimed_job is a single lookup.
+_HANDLERS: dict[str, Callable[..., dict[str, object]]] = {
+    "ingest_source": lambda conn, config, job, logger, now: _handle_ingest_source(
+        conn, config, job.payload, logger, job.id, now=now
+    ),
+    "ingest_due_sources": lambda conn, config, job, logger, now: _handle_ingest_due_sources(
+        conn, logger, now=now
+    ),
+    "test_source": lambda conn, config, job, logger, now: _handle_test_source(
+        conn, config, job.payload, logger
+    ),
+    "cve_sync": lambda conn, config, job, logger, now: _handle_cve_sync(
+        conn, config, logger, job.payload, now=now
+    ),
+    "events_rebuild": lambda conn, config, job, logger, now: _handle_events_rebuild(
+        conn, config, job.payload or {}, logger
+    ),
+    "fetch_article_content": lambda conn, config, job, logger, now: (
+        _handle_fetch_article_content(conn, config, job, job.payload, logger)
+    ),
+    "summarize_article_llm": lambda conn, config, job, logger, now: (
+        _handle_summarize_article_llm(conn, config, job, logger)
+    ),
+    "build_daily_brief": lambda conn, config, job, logger, now: _handle_build_daily_brief(
+        conn, config, job.payload, logger
+    ),
+    "write_article_markdown": lambda conn, config, job, logger, now: (
+        _run_write_article_markdown(conn, config, job, logger)
+    ),
+    "derive_events_from_articles": lambda conn, config, job, logger, now: (
+        _handle_derive_events_from_articles(conn, config, job.payload or {}, logger)
+    ),
+    "enrich_event_from_web": lambda conn, config, job, logger, now: (
+        _handle_enrich_event_from_web(conn, config, job.payload or {}, logger)
+    ),
+    "promote_event_web_source_to_article": lambda conn, config, job, logger, now: (
+        _handle_promote_event_web_source(conn, config, job.payload or {}, logger)
+    ),
+    "enrich_event_summary_llm": lambda conn, config, job, logger, now: (
+        _handle_enrich_event_summary_llm(conn, config, job.payload or {}, logger)
+    ),
+    "source_acquire": lambda conn, config, job, logger, now: _handle_source_acquire(
+        conn, config, job, logger
+    ),
+    "smoke_test": lambda conn, config, job, logger, now: _handle_smoke_test(
+        conn, config, job, logger
+    ),
+}
+
+WORKER_JOB_TYPES = list(_HANDLERS)
+
+# Network-bound job types with no retry of their own that are requeued when
+# they fail on a transient network error. fetch_article_content and cve_sync
+# are left out because they already back off and retry themselves.
+TRANSIENT_RETRY_JOB_TYPES = frozenset({"ingest_source", "enrich_event_from_web"})
+# Seconds to wait before each retry of a job that failed on a network error.
+TRANSIENT_RETRY_BACKOFF = [30, 120, 600]
+
+_RUNTIME_DIRS_READY: set[tuple[str, str]] = set()
+_SOURCE_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
 
 def _setup_logging() -> logging.Logger:
     return configure_logging("sempervigil.worker")
 
 
+def _ensure_runtime_dirs_once(config) -> None:
+    # Directory setup is idempotent, so only repeat it when the configured
+    # paths change rather than on every poll tick.
+    key = (config.paths.data_dir, config.paths.output_dir)
+    if key in _RUNTIME_DIRS_READY:
+        return
+    set_umask_from_env()
+    ensure_runtime_dirs(build_default_paths(config.paths.data_dir, config.paths.output_dir))
+    _RUNTIME_DIRS_READY.add(key)
+
+
 def run_once(worker_id: str, allowed_types: list[str] | None = None) -> int:
     logger = _setup_logging()
     try:
@@ -128,11 +187,11 @@ def run_once(worker_id: str, allowed_types: list[str] | None = None) -> int:
         log_event(logger, logging.ERROR, "config_error", error=str(exc))
         return 1
 
-    set_umask_from_env()
-    ensure_runtime_dirs(build_default_paths(config.paths.data_dir, config.paths.output_dir))
+    _ensure_runtime_dirs_once(config)
+    now = datetime.now(tz=timezone.utc)
     if _should_tick_ingest_due(allowed_types):
-        _maybe_enqueue_ingest_due_sources(conn, logger)
-    _maybe_enqueue_cve_sync(conn, logger)
+        _maybe_enqueue_ingest_due_sources(conn, logger, now=now)
+    _maybe_enqueue_cve_sync(conn, logger, now=now)
     job = claim_next_job(
         conn,
         worker_id,
@@ -141,20 +200,28 @@ def run_once(worker_id: str, allowed_types: list[str] | None = None) -> int:
     )
     if not job:
         return 0
-    return _process_claimed_job(conn, config, job, logger)
+    # Handlers take `now` as the job's current time (cve_sync ends its window
+    # there), so read the clock once the job is claimed, not at tick start.
+    job_now = datetime.now(tz=timezone.utc)
+    return _process_claimed_job(conn, config, job, logger, now=job_now)
 
 
-def _process_claimed_job(conn, config, job, logger: logging.Logger) -> int:
+def _process_claimed_job(
+    conn, config, job, logger: logging.Logger, now: datetime | None = None
+) -> int:
+    _clear_source_cache(conn)
     if is_job_canceled(conn, job.id):
         log_event(logger, logging.INFO, "job_canceled", job_id=job.id)
         return 0
 
     try:
-        result = run_claimed_job(conn, config, job, logger)
+        result = run_claimed_job(conn, config, job, logger, now=now)
     except Exception as exc:  # noqa: BLE001
         if is_job_canceled(conn, job.id):
             log_event(logger, logging.INFO, "job_canceled", job_id=job.id)
             return 0
+        if _requeue_transient(conn, job, exc, logger):
+            return 0
         fail_job(conn, job.id, str(exc))
         fields = _job_context_fields(conn, job)
         log_event(
@@ -168,7 +235,8 @@ def _process_claimed_job(conn, config, job, logger: logging.Logger) -> int:
         return 1
 
     if result.get("requeued"):
-        fields = _job_context_fields(conn, job)
+        # Context fields cost extra lookups, so skip them when INFO is filtered.
+        fields = _job_context_fields(conn, job) if logger.isEnabledFor(logging.INFO) else {}
         log_event(
             logger,
             logging.INFO,
@@ -185,13 +253,48 @@ def _process_claimed_job(conn, config, job, logger: logging.Logger) -> int:
         return 0
 
     if complete_job(conn, job.id, result=result):
-        fields = _job_context_fields(conn, job)
-        log_event(logger, logging.INFO, "job_succeeded", job_id=job.id, **fields)
+        if logger.isEnabledFor(logging.INFO):
+            fields = _job_context_fields(conn, job)
+            log_event(logger, logging.INFO, "job_succeeded", job_id=job.id, **fields)
     else:
         log_event(logger, logging.ERROR, "job_complete_failed", job_id=job.id)
     return 0
 
 
+def _is_transient_error(exc: Exception) -> bool:
+    if isinstance(exc, HTTPError):
+        return exc.code == 429 or exc.code >= 500
+    return isinstance(exc, (URLError, TimeoutError, ConnectionError))
+
+
+def _requeue_transient(conn, job, exc: Exception, logger: logging.Logger) -> bool:
+    # Shared by the worker loop and _run_jobs_inline, so a job gets the same
+    # retry_attempt count and backoff whichever path claimed it.
+    if job.job_type not in TRANSIENT_RETRY_JOB_TYPES or not _is_transient_error(exc):
+        return False
+    payload = dict(job.payload or {})
+    attempts = int(payload.get("retry_attempt", 0))
+    if attempts >= len(TRANSIENT_RETRY_BACKOFF):
+        return False
+    delay = TRANSIENT_RETRY_BACKOFF[attempts]
+    payload["retry_attempt"] = attempts + 1
+    payload["not_before"] = utc_now_iso_offset(seconds=delay)
+    if not requeue_job(conn, job.id, payload, payload["not_before"]):
+        return False
+    log_event(
+        logger,
+        logging.WARNING,
+        "job_requeued",
+        job_id=job.id,
+        job_type=job.job_type,
+        reason="transient_error",
+        error=str(exc),
+        attempt=attempts + 1,
+        next_in=delay,
+    )
+    return True
+
+
 def _process_claimed_job_thread(worker_id: str, job: Job) -> int:
     logger = _setup_logging()
     try:
@@ -202,8 +305,7 @@ def _process_claimed_job_thread(worker_id: str, job: Job) -> int:
     except ConfigError as exc:
         log_event(logger, logging.ERROR, "config_error", error=str(exc))
         return 1
-    set_umask_from_env()
-    ensure_runtime_dirs(build_default_paths(config.paths.data_dir, config.paths.output_dir))
+    _ensure_runtime_dirs_once(config)
     return _process_claimed_job(conn, config, job, logger)
 
 
@@ -233,11 +335,11 @@ def run_loop(
                 except ConfigError as exc:
                     log_event(logger, logging.ERROR, "config_error", error=str(exc))
                     break
-                set_umask_from_env()
-                ensure_runtime_dirs(build_default_paths(config.paths.data_dir, config.paths.output_dir))
+                _ensure_runtime_dirs_once(config)
+                now = datetime.now(tz=timezone.utc)
                 if _should_tick_ingest_due(allowed_types):
-                    _maybe_enqueue_ingest_due_sources(conn, logger)
-                _maybe_enqueue_cve_sync(conn, logger)
+                    _maybe_enqueue_ingest_due_sources(conn, logger, now=now)
+                _maybe_enqueue_cve_sync(conn, logger, now=now)
                 job = claim_next_job(
                     conn,
                     worker_id,
@@ -265,6 +367,7 @@ def _handle_ingest_source(
     payload: dict[str, object],
     logger: logging.Logger,
     job_id: str | None = None,
+    now: datetime | None = None,
 ) -> dict[str, object]:
     # Pipeline order: ingest creates article stubs first, then enqueues
     # fetch_article_content (if enabled + URL present). Summarization runs
@@ -272,12 +375,14 @@ def _handle_ingest_source(
     source_id = payload.get("source_id") if payload else None
     if not source_id:
         raise ValueError("ingest_source requires source_id")
-    source = get_source(conn, str(source_id))
+    source = _get_source_cached(conn, str(source_id))
     if source is None:
         raise ValueError(f"Source not found: {source_id}")
 
+    # The run's timing always comes from the clock; a caller's `now` only
+    # drives the pause check.
     started_at = utc_now_iso()
-    now_dt = _parse_iso(started_at)
+    now_dt = now or _parse_iso(started_at)
     if not source.enabled or (source.pause_until and _parse_iso(source.pause_until) > now_dt):
         record_source_run(
             conn,
@@ -375,31 +480,44 @@ def _handle_ingest_source(
         return {"canceled": True}
 
     insert_articles(conn, result.articles)
+    cve_ids_by_article = extract_cve_ids_by_article(result.articles)
+    article_ids = get_article_ids(
+        conn, [(article.source_id, article.stable_id) for article in result.articles]
+    )
+    upsert_cve_links_many(
+        conn,
+        [
+            (
+                article_ids[(article.source_id, article.stable_id)],
+                cve_ids_by_article[article.stable_id],
+                build_cve_evidence(article, cve_ids_by_article[article.stable_id]),
+            )
+            for article in result.articles
+            if article.stable_id in cve_ids_by_article
+            and (article.source_id, article.stable_id) in article_ids
+        ],
+    )
+    pending_jobs: list[tuple[str, dict[str, object]]] = []
+    events_enabled = get_events_settings(conn).get("enabled", True)
     for article in result.articles:
         if job_id and is_job_canceled(conn, job_id):
+            enqueue_jobs_bulk(conn, pending_jobs)
             return {"canceled": True}
-        cve_ids = extract_cve_ids(
-            [article.title, article.summary or "", article.original_url]
-        )
-        if not cve_ids:
-            article_id = None
-        else:
-            article_id = get_article_id(conn, article.source_id, article.stable_id)
-            if article_id is not None:
-                evidence = build_cve_evidence(article, cve_ids)
-                upsert_cve_links(conn, article_id, cve_ids, evidence)
-        if article_id is None:
-            article_id = get_article_id(conn, article.source_id, article.stable_id)
+        cve_ids = cve_ids_by_article.get(article.stable_id, [])
+        article_id = article_ids.get((article.source_id, article.stable_id))
         if article_id is not None:
-            _maybe_enqueue_fetch(conn, config, article_id, article.source_id, logger)
-        events_settings = get_events_settings(conn)
-        if events_settings.get("enabled", True) and cve_ids and article_id is not None:
+            _maybe_enqueue_fetch(
+                conn, config, article_id, article.source_id, logger, pending=pending_jobs
+            )
+        if events_enabled and cve_ids and article_id is not None:
             link_article_to_events(
                 conn,
                 article_id=article_id,
                 cve_ids=cve_ids,
                 published_at=article.published_at or article.ingested_at,
             )
+    # Follow-up jobs for the whole batch go out in one executemany/commit.
+    enqueue_jobs_bulk(conn, pending_jobs)
     if config.publishing.write_json_index:
         extra_by_stable: dict[str, dict[str, object]] | None = None
         if (
@@ -408,7 +526,7 @@ def _handle_ingest_source(
         ):
             extra_by_stable = {}
             for article in result.articles:
-                article_id = get_article_id(conn, article.source_id, article.stable_id)
+                article_id = article_ids.get((article.source_id, article.stable_id))
                 if article_id is None:
                     continue
                 hit = compute_watchlist_hits(
@@ -442,7 +560,7 @@ def _handle_test_source(
     source_id = payload.get("source_id") if payload else None
     if not source_id:
         raise ValueError("test_source requires source_id")
-    source = get_source(conn, str(source_id))
+    source = _get_source_cached(conn, str(source_id))
     if source is None:
         raise ValueError(f"Source not found: {source_id}")
     result = process_source(source, config, logger, conn, test_mode=True)
@@ -513,7 +631,7 @@ def _handle_write_article_markdown(
     if not payload:
         raise ValueError("write_article_markdown requires payload")
     source_id = str(payload.get("source_id"))
-    source_name = get_source_name(conn, source_id) or ""
+    source_name = _get_source_name_cached(conn, source_id) or ""
     batch_id = str(payload.get("batch_id") or "")
     batch_total = int(payload.get("batch_total") or 0)
     batch_index = int(payload.get("batch_index") or 0)
@@ -705,7 +823,7 @@ def _handle_summarize_article_llm(
             source_id=article["source_id"],
         )
         raise ValueError(f"llm_stage_{reason}")
-    source_name = get_source_name(conn, article["source_id"]) or ""
+    source_name = _get_source_name_cached(conn, article["source_id"]) or ""
     content = article.get("content_text") or article.get("summary") or article.get("title") or ""
     if not content.strip():
         update_article_summary(
@@ -818,7 +936,7 @@ def _handle_build_daily_brief(
     day = str(payload.get("date") or utc_now_iso().split("T")[0])
     items = list_summaries_for_day(conn, day)
     for item in items:
-        item["source_name"] = get_source_name(conn, item["source_id"]) or ""
+        item["source_name"] = _get_source_name_cached(conn, item["source_id"]) or ""
     base_content_dir = os.path.dirname(config.paths.output_dir)
     base_static_dir = os.path.dirname(config.publishing.json_index_path)
     result = write_daily_brief(
@@ -1172,7 +1290,7 @@ def _handle_source_acquire(conn, config, job, logger: logging.Logger) -> dict[st
     source_id = payload.get("source_id")
     if not source_id:
         raise ValueError("source_acquire requires source_id")
-    source = get_source(conn, str(source_id))
+    source = _get_source_cached(conn, str(source_id))
     if source is None:
         raise ValueError(f"Source not found: {source_id}")
     limit = payload.get("limit")
@@ -1304,12 +1422,15 @@ def _run_jobs_inline(
         )
         if not job:
             return
+        _clear_source_cache(conn)
         if is_job_canceled(conn, job.id):
             log_event(logger, logging.INFO, "job_canceled", job_id=job.id)
             continue
         try:
             result = run_claimed_job(conn, config, job, logger)
         except Exception as exc:  # noqa: BLE001
+            if _requeue_transient(conn, job, exc, logger):
+                continue
             fail_job(conn, job.id, str(exc))
             fields = _job_context_fields(conn, job)
             log_event(
@@ -1347,31 +1468,37 @@ def _wait_for_job(conn, job_id: str, timeout_seconds: int) -> Job | None:
     return get_job(conn, job_id)
 
 
-def _handle_ingest_due_sources(conn, logger: logging.Logger) -> dict[str, object]:
+def _handle_ingest_due_sources(
+    conn, logger: logging.Logger, now: datetime | None = None
+) -> dict[str, object]:
     # Enqueue ingest_source jobs for due sources; downstream steps are queued
     # by ingest_source after article stubs are inserted.
-    now = utc_now_iso()
-    sources = list_due_sources(conn, now)
-    enqueued: list[str] = []
-    for source in sources:
-        enqueue_job(conn, "ingest_source", {"source_id": source.id})
-        enqueued.append(source.id)
+    now_dt = now or datetime.now(tz=timezone.utc)
+    sources = list_due_sources(conn, now_dt.isoformat())
+    # Sources that already have a queued ingest_source job are skipped by the
+    # insert itself, so repeated ticks do not stack duplicate work.
+    enqueued = enqueue_source_jobs(conn, "ingest_source", [source.id for source in sources])
     log_event(
         logger,
         logging.INFO,
         "ingest_due_sources_enqueued",
         count=len(enqueued),
+        already_queued=len(sources) - len(enqueued),
     )
     return {"enqueued_count": len(enqueued), "source_ids": enqueued}
 
 
 def _handle_cve_sync(
-    conn, config, logger: logging.Logger, payload: dict[str, object] | None = None
+    conn,
+    config,
+    logger: logging.Logger,
+    payload: dict[str, object] | None = None,
+    now: datetime | None = None,
 ) -> dict[str, object]:
     settings = get_cve_settings(conn)
     if not settings.get("enabled", True):
         return {"status": "disabled"}
-    now = datetime.now(tz=timezone.utc)
+    now = now or datetime.now(tz=timezone.utc)
     last_sync = get_setting(conn, "cve.last_successful_sync_at", None)
     start = _parse_iso(last_sync) if isinstance(last_sync, str) else None
     if not start:
@@ -1468,12 +1595,14 @@ def _publish_events(conn, config, logger: logging.Logger) -> None:
     )
 
 
-def _maybe_enqueue_cve_sync(conn, logger: logging.Logger) -> None:
+def _maybe_enqueue_cve_sync(
+    conn, logger: logging.Logger, now: datetime | None = None
+) -> None:
     settings = get_cve_settings(conn)
     if not settings.get("enabled", True):
         return
     last_sync = get_setting(conn, "cve.last_successful_sync_at", None)
-    now = datetime.now(tz=timezone.utc)
+    now = now or datetime.now(tz=timezone.utc)
     if isinstance(last_sync, str):
         last_dt = _parse_iso(last_sync)
     else:
@@ -1494,21 +1623,24 @@ def _should_tick_ingest_due(allowed_types: list[str] | None) -> bool:
     )
 
 
-def _maybe_enqueue_ingest_due_sources(conn, logger: logging.Logger) -> None:
+def _maybe_enqueue_ingest_due_sources(
+    conn, logger: logging.Logger, now: datetime | None = None
+) -> None:
     if has_pending_job(conn, "ingest_due_sources"):
         return
     debounce_seconds = int(os.environ.get("SV_INGEST_DUE_DEBOUNCE_SECONDS", "60"))
     last_enqueued = get_setting(conn, "ingest_due.last_enqueued_at", None)
-    now = utc_now_iso()
+    now_dt = now or datetime.now(tz=timezone.utc)
     if isinstance(last_enqueued, str):
         last_dt = _parse_iso(last_enqueued)
-        if last_dt + timedelta(seconds=debounce_seconds) > _parse_iso(now):
+        if last_dt + timedelta(seconds=debounce_seconds) > now_dt:
             return
-    due = list_due_sources(conn, now)
+    now_iso = now_dt.isoformat()
+    due = list_due_sources(conn, now_iso)
     if not due:
         return
     enqueue_job(conn, "ingest_due_sources", None, debounce=True)
-    set_setting(conn, "ingest_due.last_enqueued_at", now)
+    set_setting(conn, "ingest_due.last_enqueued_at", now_iso)
     log_event(logger, logging.INFO, "ingest_due_sources_enqueued", due_count=len(due))
 
 
@@ -1525,6 +1657,7 @@ def _maybe_pause_source(conn, source_id: str, logger: logging.Logger | None) ->
     if streaks["consecutive_errors"] >= error_threshold:
         reason = f"auto_pause:error_streak:{streaks['consecutive_errors']}"
         pause_source(conn, source_id, reason, pause_minutes)
+        _invalidate_source_cache(conn, source_id)
         record_health_alert(conn, source_id, "error_streak", reason)
         if logger:
             log_event(
@@ -1537,6 +1670,7 @@ def _maybe_pause_source(conn, source_id: str, logger: logging.Logger | None) ->
     elif streaks["consecutive_zero"] >= zero_threshold:
         reason = f"auto_pause:zero_streak:{streaks['consecutive_zero']}"
         pause_source(conn, source_id, reason, pause_minutes)
+        _invalidate_source_cache(conn, source_id)
         record_health_alert(conn, source_id, "zero_streak", reason)
         if logger:
             log_event(
@@ -1549,9 +1683,12 @@ def _maybe_pause_source(conn, source_id: str, logger: logging.Logger | None) ->
 
 
 def _parse_iso(value: str) -> datetime:
-    if value.endswith("Z"):
-        value = value.replace("Z", "+00:00")
-    return datetime.fromisoformat(value).astimezone(timezone.utc)
+    # fromisoformat accepts a trailing "Z" on 3.11+, and stored timestamps are
+    # already UTC, so only convert when the offset actually differs.
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is timezone.utc:
+        return parsed
+    return parsed.astimezone(timezone.utc)
 
 
 def _parse_only_types(value: str | None) -> list[str] | None:
@@ -1584,47 +1721,28 @@ def main() -> int:
     return run_loop(args.worker_id, args.sleep, allowed_types, args.concurrency)
 
 
-def run_claimed_job(conn, config, job, logger: logging.Logger) -> dict[str, object]:
+def run_claimed_job(
+    conn, config, job, logger: logging.Logger, now: datetime | None = None
+) -> dict[str, object]:
     _log_job_claimed(conn, job, logger)
     if is_job_canceled(conn, job.id):
         return {"canceled": True}
-    if job.job_type == "ingest_source":
-        return _handle_ingest_source(conn, config, job.payload, logger, job.id)
-    if job.job_type == "ingest_due_sources":
-        return _handle_ingest_due_sources(conn, logger)
-    if job.job_type == "test_source":
-        return _handle_test_source(conn, config, job.payload, logger)
-    if job.job_type == "cve_sync":
-        return _handle_cve_sync(conn, config, logger, job.payload)
-    if job.job_type == "events_rebuild":
-        return _handle_events_rebuild(conn, config, job.payload or {}, logger)
-    if job.job_type == "source_acquire":
-        return _handle_source_acquire(conn, config, job, logger)
-    if job.job_type == "fetch_article_content":
-        return _handle_fetch_article_content(conn, config, job, job.payload, logger)
-    if job.job_type == "summarize_article_llm":
-        return _handle_summarize_article_llm(conn, config, job, logger)
-    if job.job_type == "build_daily_brief":
-        return _handle_build_daily_brief(conn, config, job.payload, logger)
-    if job.job_type == "write_article_markdown":
-        result = _handle_write_article_markdown(conn, config, job.payload, logger)
-        if not has_pending_job(conn, "write_article_markdown", exclude_job_id=job.id):
-            enqueue_build_site_if_needed(conn, reason="write_article_markdown")
-        return result
-    if job.job_type == "derive_events_from_articles":
-        return _handle_derive_events_from_articles(conn, config, job.payload or {}, logger)
-    if job.job_type == "enrich_event_from_web":
-        return _handle_enrich_event_from_web(conn, config, job.payload or {}, logger)
-    if job.job_type == "promote_event_web_source_to_article":
-        return _handle_promote_event_web_source(conn, config, job.payload or {}, logger)
-    if job.job_type == "enrich_event_summary_llm":
-        return _handle_enrich_event_summary_llm(conn, config, job.payload or {}, logger)
-    if job.job_type == "smoke_test":
-        return _handle_smoke_test(conn, config, job, logger)
-    raise ValueError(f"unsupported job type {job.job_type}")
+    handler = _HANDLERS.get(job.job_type)
+    if handler is None:
+        raise ValueError(f"unsupported job type {job.job_type}")
+    return handler(conn, config, job, logger, now)
+
+
+def _run_write_article_markdown(conn, config, job, logger: logging.Logger) -> dict[str, object]:
+    result = _handle_write_article_markdown(conn, config, job.payload, logger)
+    if not has_pending_job(conn, "write_article_markdown", exclude_job_id=job.id):
+        enqueue_build_site_if_needed(conn, reason="write_article_markdown")
+    return result
 
 
 def _log_job_claimed(conn, job, logger: logging.Logger) -> None:
+    if not logger.isEnabledFor(logging.INFO):
+        return
     fields = {"job_id": job.id, "job_type": job.job_type}
     fields.update(_job_context_fields(conn, job))
     log_event(logger, logging.INFO, "job_claimed", **fields)
@@ -1634,7 +1752,7 @@ def _job_context_fields(conn, job) -> dict[str, object]:
     if job.job_type in {"write_article_markdown", "fetch_article_content", "summarize_article_llm"}:
         payload = job.payload or {}
         source_id = str(payload.get("source_id") or "")
-        source_name = get_source_name(conn, source_id) or ""
+        source_name = _get_source_name_cached(conn, source_id) or ""
         article_url = payload.get("original_url")
         article_id = payload.get("article_id")
         if not article_url and article_id:
@@ -1650,21 +1768,63 @@ def _job_context_fields(conn, job) -> dict[str, object]:
     if job.job_type in {"ingest_source", "test_source"}:
         payload = job.payload or {}
         source_id = str(payload.get("source_id") or "")
-        source_name = get_source_name(conn, source_id) or ""
+        source_name = _get_source_name_cached(conn, source_id) or ""
         return {"source_id": source_id, "source_name": source_name}
     payload = job.payload or {}
     source_id = str(payload.get("source_id") or "")
-    source_name = get_source_name(conn, source_id) or ""
+    source_name = _get_source_name_cached(conn, source_id) or ""
     return {"source_id": source_id, "source_name": source_name}
 
 
+def _get_source_cached(conn, source_id: str) -> Source | None:
+    # Cached per connection and cleared at the start of every job, so one job
+    # shares its lookups (handler plus context logging) but never sees a row
+    # loaded by an earlier job on the same connection.
+    cache = _SOURCE_CACHE.setdefault(conn, {})
+    if source_id not in cache:
+        cache[source_id] = get_source(conn, source_id) if source_id else None
+    return cache[source_id]
+
+
+def _get_source_name_cached(conn, source_id: str) -> str | None:
+    source = _get_source_cached(conn, source_id)
+    return source.name if source else None
+
+
+def _clear_source_cache(conn) -> None:
+    _SOURCE_CACHE.pop(conn, None)
+
+
+def _invalidate_source_cache(conn, source_id: str) -> None:
+    cache = _SOURCE_CACHE.get(conn)
+    if cache is not None:
+        cache.pop(source_id, None)
+
+
+def _enqueue(
+    conn,
+    job_type: str,
+    payload: dict[str, object],
+    pending: list[tuple[str, dict[str, object]]] | None,
+) -> None:
+    if pending is None:
+        enqueue_job(conn, job_type, payload)
+    else:
+        pending.append((job_type, payload))
+
+
 def _maybe_enqueue_fetch(
-    conn, config, article_id: int, source_id: str, logger: logging.Logger
+    conn,
+    config,
+    article_id: int,
+    source_id: str,
+    logger: logging.Logger,
+    pending: list[tuple[str, dict[str, object]]] | None = None,
 ) -> None:
     if os.environ.get("SV_FETCH_FULL_CONTENT", "1") != "1":
-        if _maybe_enqueue_summarize(conn, article_id, source_id, logger):
+        if _maybe_enqueue_summarize(conn, article_id, source_id, logger, pending=pending):
             return
-        _enqueue_write_from_article(conn, config, article_id, source_id)
+        _enqueue_write_from_article(conn, config, article_id, source_id, pending=pending)
         return
     article = get_article_by_id(conn, article_id)
     if not article:
@@ -1672,9 +1832,9 @@ def _maybe_enqueue_fetch(
     if not (article.get("original_url") or article.get("normalized_url")):
         return
     if article["has_full_content"]:
-        if _maybe_enqueue_summarize(conn, article_id, source_id, logger):
+        if _maybe_enqueue_summarize(conn, article_id, source_id, logger, pending=pending):
             return
-        _enqueue_write_from_article(conn, config, article_id, source_id)
+        _enqueue_write_from_article(conn, config, article_id, source_id, pending=pending)
         return
     if has_pending_article_job(conn, "fetch_article_content", article_id):
         return
@@ -1690,17 +1850,21 @@ def _maybe_enqueue_fetch(
             content_error="max_retries_exceeded",
             has_full_content=False,
         )
-        _enqueue_write_from_article(conn, config, article_id, source_id)
+        _enqueue_write_from_article(conn, config, article_id, source_id, pending=pending)
         return
     payload = {"article_id": article_id, "source_id": source_id}
     if attempts > 0:
         delay = backoff[min(attempts - 1, len(backoff) - 1)]
         payload["not_before"] = utc_now_iso_offset(seconds=delay)
-    enqueue_job(conn, "fetch_article_content", payload)
+    _enqueue(conn, "fetch_article_content", payload, pending)
 
 
 def _maybe_enqueue_summarize(
-    conn, article_id: int, source_id: str, logger: logging.Logger
+    conn,
+    article_id: int,
+    source_id: str,
+    logger: logging.Logger,
+    pending: list[tuple[str, dict[str, object]]] | None = None,
 ) -> bool:
     profile, reason = get_active_profile_for_stage(conn, "summarize_article")
     if not profile:
@@ -1720,15 +1884,22 @@ def _maybe_enqueue_summarize(
         return False
     if article.get("summary_llm"):
         return False
-    enqueue_job(
+    _enqueue(
         conn,
         "summarize_article_llm",
         {"article_id": article_id, "source_id": source_id, "profile_id": profile.get("id")},
+        pending,
     )
     return True
 
 
-def _enqueue_write_from_article(conn, config, article_id: int, source_id: str) -> None:
+def _enqueue_write_from_article(
+    conn,
+    config,
+    article_id: int,
+    source_id: str,
+    pending: list[tuple[str, dict[str, object]]] | None = None,
+) -> None:
     article = get_article_by_id(conn, article_id)
     if not article:
         return
@@ -1769,7 +1940,7 @@ def _enqueue_write_from_article(conn, config, article_id: int, source_id: str) -
         )
         if hit.get("hit"):
             payload["watchlist_hit"] = True
-    enqueue_job(conn, "write_article_markdown", payload)
+    _enqueue(conn, "write_article_markdown", payload, pending)
 
 
 if __name__ == "__main__":
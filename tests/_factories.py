@@ -0,0 +1,122 @@
+from sempervigil.models import Article, Source
+from sempervigil.storage import insert_articles, upsert_cve, upsert_source
+
+_CVE_DEFAULTS = {
+    "published_at": "2025-01-01T00:00:00Z",
+    "last_modified_at": "2025-01-02T00:00:00Z",
+    "preferred_cvss_version": "3.1",
+    "preferred_base_score": 7.5,
+    "preferred_base_severity": "HIGH",
+    "preferred_vector": "AV:N/AC:L",
+    "cvss_v40_json": None,
+    "cvss_v31_json": None,
+    "description_text": "Test CVE",
+    "affected_products": [],
+    "affected_cpes": [],
+    "reference_domains": [],
+}
+
+_ARTICLE_DEFAULTS = {
+    "id": None,
+    "stable_id": "stable-1",
+    "original_url": "https://example.com/1",
+    "normalized_url": "https://example.com/1",
+    "title": "Example title",
+    "source_id": "source-1",
+    "published_at": "2025-01-01T00:00:00Z",
+    "published_at_source": "published",
+    "ingested_at": "2025-01-01T01:00:00Z",
+    "summary": None,
+    "tags": [],
+}
+
+_SOURCE_DEFAULTS = {
+    "id": "s1",
+    "name": "Source",
+    "enabled": True,
+    "base_url": "https://example.com",
+    "topic_key": None,
+    "default_frequency_minutes": 60,
+    "pause_until": None,
+    "paused_reason": None,
+    "robots_notes": None,
+}
+
+
+_CVE_ITEM_BASE = {
+    "id": "",
+    "published": "2025-01-01T00:00:00Z",
+    "lastModified": "2025-01-02T00:00:00Z",
+    "descriptions": [{"lang": "en", "value": "desc"}],
+    "metrics": {},
+}
+
+
+def _cvss_metric(score: float, severity: str | None, vector: str | None) -> list[dict]:
+    return [
+        {
+            "cvssData": {"baseScore": score, "baseSeverity": severity, "vectorString": vector},
+            "exploitabilityScore": 1.0,
+            "impactScore": 1.0,
+        }
+    ]
+
+
+def make_cve_item(
+    cve_id: str,
+    v31_score: float,
+    v31_severity: str,
+    v31_vector: str,
+    v40_score: float | None = None,
+    v40_severity: str | None = None,
+    v40_vector: str | None = None,
+) -> dict:
+    # An NVD API 2.0 "cve" object as returned by _fetch_page.
+    metrics = {"cvssMetricV31": _cvss_metric(v31_score, v31_severity, v31_vector)}
+    if v40_score is not None:
+        metrics["cvssMetricV40"] = _cvss_metric(v40_score, v40_severity, v40_vector)
+    return {**_CVE_ITEM_BASE, "id": cve_id, "metrics": metrics}
+
+
+def make_cve(conn, cve_id: str = "CVE-2025-0001", **overrides) -> str:
+    upsert_cve(conn, **{**_CVE_DEFAULTS, **overrides, "cve_id": cve_id})
+    return cve_id
+
+
+def build_article(**overrides) -> Article:
+    return Article(**{**_ARTICLE_DEFAULTS, **overrides})
+
+
+def make_article(conn, **overrides) -> Article:
+    article = build_article(**overrides)
+    insert_articles(conn, [article])
+    return article
+
+
+def seed_articles(conn, urls: list[str], source_id: str = "source-1") -> list[int]:
+    # Raw rows without extracted content, for the fetch/summarize pipeline
+    # tests. One multi-row INSERT in one transaction however many URLs are seeded.
+    stamp = "2025-01-01T00:00:00Z"
+    rows = [
+        (source_id, f"stable-{url}", url, url, "Title", stamp, "2025-01-01", stamp, stamp)
+        for url in urls
+    ]
+    values = ",".join(["(%s, %s, %s, %s, %s, %s, %s, %s, %s)"] * len(rows))
+    upsert_source(conn, {"id": source_id, "name": "Example", "enabled": True})
+    with conn.transaction():
+        cursor = conn.execute(
+            f"""
+            INSERT INTO articles
+                (source_id, stable_id, original_url, normalized_url, title,
+                 ingested_at, brief_day, created_at, updated_at)
+            VALUES {values}
+            ON CONFLICT(source_id, stable_id) DO UPDATE SET updated_at = EXCLUDED.updated_at
+            RETURNING id
+            """,
+            [value for row in rows for value in row],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def make_source(**overrides) -> Source:
+    return Source(**{**_SOURCE_DEFAULTS, **overrides})
@@ -0,0 +1,54 @@
+import base64
+import logging
+import pickle
+from functools import cache
+
+
+TEST_MASTER_KEY = base64.urlsafe_b64encode(b"c" * 32).decode("utf-8")
+
+
+# Logger handed to worker handlers under test. Their per-item INFO events are
+# dropped at the isEnabledFor check (log_event skips formatting entirely);
+# warnings and errors still reach pytest's captured output.
+QUIET_LOGGER = logging.getLogger("sempervigil.tests")
+QUIET_LOGGER.setLevel(logging.WARNING)
+
+
+@cache
+def _pickled_default(name: str) -> bytes:
+    from sempervigil import config
+
+    return pickle.dumps(getattr(config, name), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+# The defaults never change during a run, so serialize them once and hand out
+# fresh copies by unpickling the cached bytes.
+def default_config() -> dict:
+    return pickle.loads(_pickled_default("DEFAULT_CONFIG"))
+
+
+def default_cve_settings() -> dict:
+    return pickle.loads(_pickled_default("DEFAULT_CVE_SETTINGS"))
+
+
+def default_events_settings() -> dict:
+    return pickle.loads(_pickled_default("DEFAULT_EVENTS_SETTINGS"))
+
+
+def count_at_most(conn, table: str, cap: int, where: str, params: tuple = ()) -> int:
+    # Row count capped at cap + 1: enough to tell "exactly n" apart from
+    # "more than n" without counting every match. The database is shared
+    # across tests, so callers always scope the count to their own rows.
+    row = conn.execute(
+        f"SELECT COUNT(*) FROM (SELECT 1 FROM {table} WHERE {where} LIMIT %s) AS capped",
+        (*params, cap + 1),
+    ).fetchone()
+    return row[0]
+
+
+def login_admin(client, token: str = "secret") -> None:
+    # The admin cookie carries the token itself, so set it directly instead of
+    # posting to /ui/login; test_ui_login_cookie_flow covers the real route.
+    from sempervigil.admin import ADMIN_COOKIE_NAME
+
+    client.cookies.set(ADMIN_COOKIE_NAME, token)
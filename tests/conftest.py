@@ -1,9 +1,131 @@
 from __future__ import annotations
 
 import os
+from urllib.parse import urlsplit, urlunsplit
+
 import pytest
 
+from _helpers import TEST_MASTER_KEY, default_config
+
 
 def pytest_sessionstart(session) -> None:
     if not os.environ.get("SV_DB_URL"):
         pytest.skip("SV_DB_URL is required for Postgres-only tests", allow_module_level=True)
+    # Test databases are disposable, so don't wait on a WAL flush for every
+    # commit. libpq applies PGOPTIONS to each connection psycopg opens.
+    os.environ.setdefault("PGOPTIONS", "-c synchronous_commit=off")
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker:
+        os.environ["SV_DB_URL"] = _worker_db_url(os.environ["SV_DB_URL"], worker)
+
+
+def _worker_db_url(url: str, worker: str) -> str:
+    # Under pytest-xdist every worker gets its own database, so tests that
+    # wipe or count whole tables cannot see another worker's rows.
+    import psycopg
+
+    parts = urlsplit(url)
+    name = f"{parts.path.lstrip('/') or 'postgres'}_{worker}"
+    with psycopg.connect(url, autocommit=True) as conn:
+        exists = conn.execute("SELECT 1 FROM pg_database WHERE datname = %s", (name,)).fetchone()
+        if not exists:
+            conn.execute(f'CREATE DATABASE "{name}"')
+    return urlunsplit(parts._replace(path=f"/{name}"))
+
+
+@pytest.fixture(scope="session")
+def _admin_client():
+    from fastapi.testclient import TestClient
+
+    from sempervigil.admin import app
+
+    return TestClient(app)
+
+
+@pytest.fixture
+def client(_admin_client):
+    _admin_client.cookies.clear()
+    return _admin_client
+
+
+@pytest.fixture(scope="session")
+def _shared_conn():
+    from sempervigil.storage import init_db
+
+    conn = init_db()
+    yield conn
+    conn.close()
+
+
+class _RollbackConn:
+    # Storage helpers commit after each write. psycopg rejects an explicit
+    # commit() inside db_conn's outer transaction, and that transaction is
+    # rolled back anyway, so the wrapper drops them. The helpers' own
+    # conn.transaction() blocks nest as savepoints.
+    def __init__(self, conn) -> None:
+        self._conn = conn
+
+    def commit(self) -> None:
+        pass
+
+    def __getattr__(self, name: str):
+        return getattr(self._conn, name)
+
+
+@pytest.fixture
+def db_conn(_shared_conn):
+    # For storage-only tests that never read data through another
+    # connection. Each test runs inside one transaction on the shared
+    # connection that is always rolled back, so its rows never reach the
+    # next test.
+    with _shared_conn.transaction(force_rollback=True):
+        yield _RollbackConn(_shared_conn)
+
+
+@pytest.fixture
+def empty_job_queue(db_conn):
+    # For tests that claim "the oldest queued job": jobs committed by other
+    # tests may still be queued. The delete is rolled back with the test.
+    db_conn.execute("DELETE FROM jobs")
+    return db_conn
+
+
+@pytest.fixture(scope="session")
+def _config_template():
+    return default_config()
+
+
+@pytest.fixture
+def seeded_conn(tmp_path, _config_template):
+    from sempervigil.config import set_runtime_config
+    from sempervigil.storage import init_db
+
+    data_dir = tmp_path / "data"
+    conn = init_db()
+    # set_runtime_config stores its own deep copy, so overlaying only the
+    # tmp_path-dependent sections onto the shared template is safe.
+    config = {
+        **_config_template,
+        "paths": {
+            **_config_template["paths"],
+            "data_dir": str(data_dir),
+            "output_dir": str(tmp_path / "site" / "content" / "posts"),
+            "run_reports_dir": str(data_dir / "reports"),
+        },
+        "publishing": {
+            **_config_template["publishing"],
+            "json_index_path": str(tmp_path / "site" / "static" / "sempervigil" / "index.json"),
+        },
+    }
+    set_runtime_config(conn, config)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def master_key(monkeypatch):
+    from sempervigil.security.secrets import KEY_ID_ENV, MASTER_KEY_ENV
+
+    monkeypatch.setenv(MASTER_KEY_ENV, TEST_MASTER_KEY)
+    monkeypatch.setenv(KEY_ID_ENV, "v1")
+    return TEST_MASTER_KEY
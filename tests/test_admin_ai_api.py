@@ -1,37 +1,10 @@
-import base64
-import copy
-from fastapi.testclient import TestClient
+from _helpers import login_admin
 
-from sempervigil.admin import app
-from sempervigil.config import DEFAULT_CONFIG, set_runtime_config
-from sempervigil.security.secrets import MASTER_KEY_ENV, KEY_ID_ENV
-from sempervigil.storage import init_db
 
-
-def _seed_runtime_config(tmp_path, monkeypatch):
-    data_dir = tmp_path / "data"
-    monkeypatch.setenv("SV_DATA_DIR", str(data_dir))
-    conn = init_db()
-    config = copy.deepcopy(DEFAULT_CONFIG)
-    config["paths"]["data_dir"] = str(data_dir)
-    config["paths"]["output_dir"] = str(tmp_path / "site" / "content" / "posts")
-    config["paths"]["run_reports_dir"] = str(data_dir / "reports")
-    config["publishing"]["json_index_path"] = str(
-        tmp_path / "site" / "static" / "sempervigil" / "index.json"
-    )
-    set_runtime_config(conn, config)
-
-
-def test_admin_ai_provider_secret_flow(tmp_path, monkeypatch):
-    _seed_runtime_config(tmp_path, monkeypatch)
+def test_admin_ai_provider_secret_flow(monkeypatch, seeded_conn, master_key, client):
     monkeypatch.setenv("SV_ADMIN_TOKEN", "secret")
-    master = base64.urlsafe_b64encode(b"c" * 32).decode("utf-8")
-    monkeypatch.setenv(MASTER_KEY_ENV, master)
-    monkeypatch.setenv(KEY_ID_ENV, "v1")
 
-    client = TestClient(app)
-    login = client.post("/ui/login", json={"token": "secret"})
-    assert login.status_code == 200
+    login_admin(client)
 
     provider_payload = {
         "name": "OpenAI",
@@ -1,33 +1,9 @@
-import copy
+from _helpers import login_admin
 
-from fastapi.testclient import TestClient
 
-from sempervigil.admin import app
-from sempervigil.config import DEFAULT_CONFIG, set_runtime_config
-from sempervigil.storage import init_db
-
-
-def _seed_runtime_config(tmp_path, monkeypatch):
-    data_dir = tmp_path / "data"
-    monkeypatch.setenv("SV_DATA_DIR", str(data_dir))
-    conn = init_db()
-    config = copy.deepcopy(DEFAULT_CONFIG)
-    config["paths"]["data_dir"] = str(data_dir)
-    config["paths"]["output_dir"] = str(tmp_path / "site" / "content" / "posts")
-    config["paths"]["run_reports_dir"] = str(data_dir / "reports")
-    config["publishing"]["json_index_path"] = str(
-        tmp_path / "site" / "static" / "sempervigil" / "index.json"
-    )
-    set_runtime_config(conn, config)
-    return conn
-
-
-def test_analytics_endpoints_no_error(tmp_path, monkeypatch):
-    _seed_runtime_config(tmp_path, monkeypatch)
+def test_analytics_endpoints_no_error(monkeypatch, seeded_conn, client):
     monkeypatch.setenv("SV_ADMIN_TOKEN", "secret")
-    client = TestClient(app)
-    login = client.post("/ui/login", json={"token": "secret"})
-    assert login.status_code == 200
+    login_admin(client)
 
     articles = client.get("/admin/analytics/articles_per_day?days=7")
     assert articles.status_code == 200
@@ -1,31 +1,17 @@
-import copy
+from sempervigil.config import set_cve_settings
+from sempervigil.storage import upsert_source
 
-from fastapi.testclient import TestClient
+from _factories import make_article, make_cve
+from _helpers import default_cve_settings, login_admin
 
-from sempervigil.admin import app
-from sempervigil.config import DEFAULT_CONFIG, DEFAULT_CVE_SETTINGS, set_cve_settings, set_runtime_config
-from sempervigil.models import Article
-from sempervigil.storage import init_db, insert_articles, upsert_cve, upsert_source
 
-
-def _seed_runtime_config(tmp_path, monkeypatch):
-    data_dir = tmp_path / "data"
-    monkeypatch.setenv("SV_DATA_DIR", str(data_dir))
-    conn = init_db()
-    config = copy.deepcopy(DEFAULT_CONFIG)
-    config["paths"]["data_dir"] = str(data_dir)
-    config["paths"]["output_dir"] = str(tmp_path / "site" / "content" / "posts")
-    config["paths"]["run_reports_dir"] = str(data_dir / "reports")
-    config["publishing"]["json_index_path"] = str(
-        tmp_path / "site" / "static" / "sempervigil" / "index.json"
-    )
-    set_runtime_config(conn, config)
-    set_cve_settings(conn, copy.deepcopy(DEFAULT_CVE_SETTINGS))
+def _seed_settings(conn):
+    set_cve_settings(conn, default_cve_settings())
     return conn
 
 
-def test_content_search_mixed_results(tmp_path, monkeypatch):
-    conn = _seed_runtime_config(tmp_path, monkeypatch)
+def test_content_search_mixed_results(monkeypatch, seeded_conn, client):
+    conn = _seed_settings(seeded_conn)
     monkeypatch.setenv("SV_ADMIN_TOKEN", "secret")
 
     upsert_source(
@@ -37,40 +23,26 @@ def test_content_search_mixed_results(tmp_path, monkeypatch):
             "url": "https://example.com/feed.xml",
         },
     )
-    article = Article(
-        id=None,
-        stable_id="stable-1",
+    make_article(
+        conn,
         original_url="https://example.com/article-1",
         normalized_url="https://example.com/article-1",
         title="Widget advisory roundup",
-        source_id="source-1",
         published_at="2025-01-03T00:00:00Z",
-        published_at_source="published",
         ingested_at="2025-01-03T01:00:00Z",
         summary="Widget summary",
         tags=["widget"],
     )
-    insert_articles(conn, [article])
-    upsert_cve(
+    make_cve(
         conn,
-        cve_id="CVE-2025-1000",
-        published_at="2025-01-01T00:00:00Z",
-        last_modified_at="2025-01-02T00:00:00Z",
-        preferred_cvss_version="3.1",
-        preferred_base_score=7.5,
-        preferred_base_severity="HIGH",
-        preferred_vector="AV:N/AC:L",
-        cvss_v40_json=None,
-        cvss_v31_json=None,
+        "CVE-2025-1000",
         description_text="Widget vulnerability",
         affected_products=["widget"],
         affected_cpes=["cpe:2.3:a:vendor:widget:*:*:*:*:*:*:*:*"],
         reference_domains=["example.com"],
     )
 
-    client = TestClient(app)
-    login = client.post("/ui/login", json={"token": "secret"})
-    assert login.status_code == 200
+    login_admin(client)
 
     response = client.get("/admin/api/content/search?query=widget&type=all")
     assert response.status_code == 200
@@ -1,40 +1,19 @@
-import copy
-from fastapi.testclient import TestClient
+from _helpers import login_admin
 
-from sempervigil.admin import app
-from sempervigil.config import DEFAULT_CONFIG, set_runtime_config
-from sempervigil.storage import init_db
+_SOURCE_PAYLOAD = {
+    "id": "test-source",
+    "name": "Test Source",
+    "kind": "rss",
+    "url": "https://example.com/feed",
+    "enabled": True,
+    "interval_minutes": 30,
+}
 
 
-def _seed_runtime_config(tmp_path, monkeypatch):
-    data_dir = tmp_path / "data"
-    monkeypatch.setenv("SV_DATA_DIR", str(data_dir))
-    conn = init_db()
-    config = copy.deepcopy(DEFAULT_CONFIG)
-    config["paths"]["data_dir"] = str(data_dir)
-    config["paths"]["output_dir"] = str(tmp_path / "site" / "content" / "posts")
-    config["paths"]["run_reports_dir"] = str(data_dir / "reports")
-    config["publishing"]["json_index_path"] = str(
-        tmp_path / "site" / "static" / "sempervigil" / "index.json"
-    )
-    set_runtime_config(conn, config)
-
-
-def test_sources_crud(tmp_path, monkeypatch):
-    _seed_runtime_config(tmp_path, monkeypatch)
+def test_sources_crud(monkeypatch, seeded_conn, client):
     monkeypatch.delenv("SV_ADMIN_TOKEN", raising=False)
-    client = TestClient(app)
 
-    payload = {
-        "id": "test-source",
-        "name": "Test Source",
-        "kind": "rss",
-        "url": "https://example.com/feed",
-        "enabled": True,
-        "interval_minutes": 30,
-        "tags": ["security"],
-    }
-    response = client.post("/sources", json=payload)
+    response = client.post("/sources", json={**_SOURCE_PAYLOAD, "tags": ["security"]})
     assert response.status_code == 200
 
     response = client.get("/sources")
@@ -54,24 +33,13 @@ def test_sources_crud(tmp_path, monkeypatch):
     assert response.status_code == 200
 
 
-def test_sources_requires_cookie_when_token_set(tmp_path, monkeypatch):
-    _seed_runtime_config(tmp_path, monkeypatch)
+def test_sources_requires_cookie_when_token_set(monkeypatch, seeded_conn, client):
     monkeypatch.setenv("SV_ADMIN_TOKEN", "secret")
-    client = TestClient(app)
 
-    payload = {
-        "id": "test-source",
-        "name": "Test Source",
-        "kind": "rss",
-        "url": "https://example.com/feed",
-        "enabled": True,
-        "interval_minutes": 30,
-    }
-    response = client.post("/sources", json=payload)
+    response = client.post("/sources", json=_SOURCE_PAYLOAD)
     assert response.status_code == 401
 
-    login = client.post("/ui/login", json={"token": "secret"})
-    assert login.status_code == 200
+    login_admin(client)
 
-    response = client.post("/sources", json=payload)
+    response = client.post("/sources", json=_SOURCE_PAYLOAD)
     assert response.status_code == 200
@@ -1,29 +1,12 @@
-import copy
 from datetime import datetime, timezone
 
 from sempervigil import builder
-from sempervigil.config import DEFAULT_CONFIG, set_runtime_config
-from sempervigil.storage import enqueue_job, init_db
+from sempervigil.storage import enqueue_job
 from sempervigil.utils import utc_now_iso
 
 
-def _seed_runtime_config(tmp_path, monkeypatch):
-    data_dir = tmp_path / "data"
-    monkeypatch.setenv("SV_DATA_DIR", str(data_dir))
-    conn = init_db()
-    config = copy.deepcopy(DEFAULT_CONFIG)
-    config["paths"]["data_dir"] = str(data_dir)
-    config["paths"]["output_dir"] = str(tmp_path / "site" / "content" / "posts")
-    config["paths"]["run_reports_dir"] = str(data_dir / "reports")
-    config["publishing"]["json_index_path"] = str(
-        tmp_path / "site" / "static" / "sempervigil" / "index.json"
-    )
-    set_runtime_config(conn, config)
-    return conn
-
-
-def test_build_job_writes_result(tmp_path, monkeypatch):
-    conn = _seed_runtime_config(tmp_path, monkeypatch)
+def test_build_job_writes_result(monkeypatch, seeded_conn):
+    conn = seeded_conn
     enqueue_job(conn, "build_site", None)
 
     def fake_run(conn, job_id):
@@ -38,8 +21,8 @@ def test_build_job_writes_result(tmp_path, monkeypatch):
     assert "stderr_tail" in row[0]
 
 
-def test_build_job_debounce_requeues(tmp_path, monkeypatch):
-    conn = _seed_runtime_config(tmp_path, monkeypatch)
+def test_build_job_debounce_requeues(monkeypatch, seeded_conn):
+    conn = seeded_conn
     now = utc_now_iso()
     conn.execute(
         """
@@ -1,8 +1,14 @@
-import copy
-
-from sempervigil.config import DEFAULT_CONFIG, bootstrap_runtime_config, get_runtime_config, set_runtime_config
+from sempervigil.config import (
+    DEFAULT_CONFIG,
+    bootstrap_runtime_config,
+    get_runtime_config,
+    load_runtime_config,
+    set_runtime_config,
+)
 from sempervigil.storage import init_db
 
+from _helpers import default_config
+
 
 def test_bootstrap_creates_runtime_config(tmp_path):
     conn = init_db()
@@ -12,7 +18,7 @@ def test_bootstrap_creates_runtime_config(tmp_path):
 
 def test_get_runtime_config_after_set(tmp_path):
     conn = init_db()
-    custom = copy.deepcopy(DEFAULT_CONFIG)
+    custom = default_config()
     custom["app"]["name"] = "Test"
     set_runtime_config(conn, custom)
     cfg = get_runtime_config(conn)
@@ -28,3 +34,16 @@ def test_set_runtime_config_rejects_invalid(tmp_path):
         assert "Invalid config.runtime" in str(exc)
     else:
         raise AssertionError("Expected validation error")
+
+
+def test_load_runtime_config_reuses_build_until_changed(seeded_conn):
+    conn = seeded_conn
+    first = load_runtime_config(conn)
+    assert load_runtime_config(conn) is first
+
+    custom = get_runtime_config(conn)
+    custom["app"]["name"] = "Renamed"
+    set_runtime_config(conn, custom)
+    reloaded = load_runtime_config(conn)
+    assert reloaded is not first
+    assert reloaded.app.name == "Renamed"
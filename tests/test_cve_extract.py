@@ -1,5 +1,5 @@
 from sempervigil.models import Article
-from sempervigil.signals import build_cve_evidence, extract_cve_ids
+from sempervigil.signals import build_cve_evidence, extract_cve_ids, extract_cve_ids_by_article
 
 
 def test_extract_cve_ids_normalizes_case_and_dedupes():
@@ -13,6 +13,13 @@ def test_extract_cve_ids_multiple_fields():
     assert cves == ["CVE-2023-1111", "CVE-2023-2222"]
 
 
+def test_extract_cve_ids_large_blob():
+    filler = "no identifiers in this sentence. " * 3000
+    blob = f"{filler}cve-2024-0001 {filler}CVE-2024-0002 {filler}CVE-2024-0001"
+    assert len(blob) > 100_000
+    assert extract_cve_ids([blob, "", filler]) == ["CVE-2024-0001", "CVE-2024-0002"]
+
+
 def test_build_cve_evidence_structure():
     article = Article(
         id=None,
@@ -31,3 +38,38 @@ def test_build_cve_evidence_structure():
     assert evidence["extracted_signals"]["cve_ids"] == ["CVE-2025-12345"]
     assert evidence["final_decision"]["rule_ids"] == ["rule.cve.explicit"]
     assert evidence["citations"]["urls"] == ["https://example.com/article"]
+
+
+def _article(stable_id: str, title: str, summary: str | None = None) -> Article:
+    return Article(
+        id=None,
+        stable_id=stable_id,
+        original_url=f"https://example.com/{stable_id}",
+        normalized_url=f"https://example.com/{stable_id}",
+        title=title,
+        source_id="source-1",
+        published_at=None,
+        published_at_source=None,
+        ingested_at="2025-01-01T00:00:00Z",
+        summary=summary,
+        tags=[],
+    )
+
+
+def test_extract_cve_ids_by_article_maps_matches():
+    articles = [
+        _article("a", "Quiet day"),
+        _article("b", "cve-2024-1234 exploited", "Also CVE-2024-1234 and CVE-2024-5678"),
+        _article("c", "Nothing here", None),
+        _article("d", "Patch", "Fixes CVE-2023-1111"),
+    ]
+    mapped = extract_cve_ids_by_article(articles)
+    assert mapped == {
+        "b": ["CVE-2024-1234", "CVE-2024-5678"],
+        "d": ["CVE-2023-1111"],
+    }
+
+
+def test_extract_cve_ids_by_article_without_mentions():
+    assert extract_cve_ids_by_article([_article("a", "Quiet day")]) == {}
+    assert extract_cve_ids_by_article([]) == {}
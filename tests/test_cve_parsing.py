@@ -32,6 +32,27 @@ def test_extract_signals_configurations_list():
     assert "example.com" in signals.reference_domains
 
 
+def test_extract_signals_repeated_and_nested_cpes():
+    widget = "cpe:2.3:a:acme:widget:1.2:*:*:*:*:*:*:*"
+    cve_item = {
+        "configurations": {
+            "nodes": [
+                {
+                    "cpeMatch": [{"criteria": widget}, {"criteria": widget}],
+                    "children": [
+                        {"cpeMatch": [{"criteria": "cpe:2.3:a:acme:gadget:-:*:*:*:*:*:*:*"}]}
+                    ],
+                }
+            ]
+        }
+    }
+    signals = extract_signals(cve_item)
+    assert signals.vendors == ["acme"]
+    assert signals.products == ["gadget", "widget"]
+    assert signals.product_versions == ["acme:widget:1.2"]
+    assert len(signals.cpes) == 2
+
+
 def test_extract_cvss_list_and_preferred():
     entries = [
         {
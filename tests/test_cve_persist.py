@@ -1,10 +1,12 @@
 from sempervigil.models import Article
 from sempervigil.signals import build_cve_evidence, extract_cve_ids
-from sempervigil.storage import get_article_id, init_db, insert_articles, upsert_cve_links
+from sempervigil.storage import get_article_id, insert_articles, upsert_cve_links
 
+from _helpers import count_at_most
 
-def test_upsert_cve_links_idempotent(tmp_path):
-    conn = init_db()
+
+def test_upsert_cve_links_idempotent(db_conn):
+    conn = db_conn
     conn.execute(
         """
         CREATE TABLE article_cves (
@@ -46,14 +48,15 @@ def test_upsert_cve_links_idempotent(tmp_path):
     upsert_cve_links(conn, article_id, cve_ids, evidence)
     upsert_cve_links(conn, article_id, cve_ids, evidence)
 
-    cursor = conn.execute("SELECT COUNT(*) FROM article_cves")
-    assert cursor.fetchone()[0] == 1
+    assert count_at_most(conn, "article_cves", 1, "article_id = %s", (article_id,)) == 1
 
     row = conn.execute(
         """
         SELECT confidence, confidence_band, matched_by, inference_level, reasons_json, evidence_json
         FROM article_cves
-        """
+        WHERE article_id = %s
+        """,
+        (article_id,),
     ).fetchone()
     assert row is not None
     confidence, band, matched_by, inference_level, reasons_json, evidence_json = row
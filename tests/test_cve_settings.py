@@ -1,18 +1,17 @@
-import copy
-
 from sempervigil.config import DEFAULT_CVE_SETTINGS, bootstrap_cve_settings, get_cve_settings, set_cve_settings
-from sempervigil.storage import init_db
+
+from _helpers import default_cve_settings
 
 
-def test_cve_settings_bootstrap(tmp_path):
-    conn = init_db()
+def test_cve_settings_bootstrap(db_conn):
+    conn = db_conn
     settings = bootstrap_cve_settings(conn)
     assert settings == DEFAULT_CVE_SETTINGS
 
 
-def test_cve_settings_update(tmp_path):
-    conn = init_db()
-    settings = copy.deepcopy(DEFAULT_CVE_SETTINGS)
+def test_cve_settings_update(db_conn):
+    conn = db_conn
+    settings = default_cve_settings()
     settings["enabled"] = False
     set_cve_settings(conn, settings)
     loaded = get_cve_settings(conn)
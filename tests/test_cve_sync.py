@@ -1,111 +1,74 @@
 import json
-
-from sempervigil import cve_sync
 from dataclasses import asdict
 
+from sempervigil import cve_sync
 from sempervigil.cve_sync import (
     CveSyncConfig,
     PreferredMetrics,
+    _metrics_dict,
     _snapshot_hash,
     process_cve_item,
     sync_cves,
 )
-from sempervigil.storage import (
-    claim_next_job,
-    complete_job,
-    enqueue_job,
-    init_db,
-    insert_cve_snapshot,
-)
+from sempervigil.storage import claim_next_job, complete_job, enqueue_job, insert_cve_snapshot
 
+from _factories import make_cve_item
+from _helpers import count_at_most
 
-def _make_cve_item(
-    cve_id: str,
-    v31_score: float,
-    v31_severity: str,
-    v31_vector: str,
-    v40_score: float | None = None,
-    v40_severity: str | None = None,
-    v40_vector: str | None = None,
-) -> dict:
-    metrics = {
-        "cvssMetricV31": [
-            {
-                "cvssData": {
-                    "baseScore": v31_score,
-                    "baseSeverity": v31_severity,
-                    "vectorString": v31_vector,
-                },
-                "exploitabilityScore": 1.0,
-                "impactScore": 1.0,
-            }
-        ]
-    }
-    if v40_score is not None:
-        metrics["cvssMetricV40"] = [
-            {
-                "cvssData": {
-                    "baseScore": v40_score,
-                    "baseSeverity": v40_severity,
-                    "vectorString": v40_vector,
-                },
-                "exploitabilityScore": 1.0,
-                "impactScore": 1.0,
-            }
-        ]
-    return {
-        "id": cve_id,
-        "published": "2025-01-01T00:00:00Z",
-        "lastModified": "2025-01-02T00:00:00Z",
-        "descriptions": [{"lang": "en", "value": "desc"}],
-        "metrics": metrics,
-    }
+
+def _process(conn, item):
+    return process_cve_item(
+        conn, item, prefer_v4=True, filters={}, scope_min_cvss=None, watchlist_enabled=False
+    )
 
 
-def test_snapshot_insert_creates_no_changes(tmp_path):
-    conn = init_db()
-    item = _make_cve_item("CVE-2025-1111", 5.0, "MEDIUM", "AV:N/AC:L")
-    result = process_cve_item(conn, item, prefer_v4=True, filters={}, scope_min_cvss=None, watchlist_enabled=False)
+def test_snapshot_insert_creates_no_changes(db_conn):
+    conn = db_conn
+    item = make_cve_item("CVE-2025-1111", 5.0, "MEDIUM", "AV:N/AC:L")
+    result = _process(conn, item)
     assert result.new_snapshot is True
     assert result.change_count == 0
-    assert conn.execute("SELECT COUNT(*) FROM cves").fetchone()[0] == 1
-    assert conn.execute("SELECT COUNT(*) FROM cve_snapshots").fetchone()[0] == 1
-    assert conn.execute("SELECT COUNT(*) FROM cve_changes").fetchone()[0] == 0
+    assert count_at_most(conn, "cves", 1, "cve_id = %s", ("CVE-2025-1111",)) == 1
+    assert count_at_most(conn, "cve_snapshots", 1, "cve_id = %s", ("CVE-2025-1111",)) == 1
+    assert count_at_most(conn, "cve_changes", 0, "cve_id = %s", ("CVE-2025-1111",)) == 0
 
 
-def test_severity_upgrade_detection(tmp_path):
-    conn = init_db()
-    first = _make_cve_item("CVE-2025-2222", 5.0, "MEDIUM", "AV:N/AC:L")
-    second = _make_cve_item("CVE-2025-2222", 7.5, "HIGH", "AV:N/AC:L")
-    process_cve_item(conn, first, prefer_v4=True, filters={}, scope_min_cvss=None, watchlist_enabled=False)
-    result = process_cve_item(conn, second, prefer_v4=True, filters={}, scope_min_cvss=None, watchlist_enabled=False)
+def test_severity_upgrade_detection(db_conn):
+    conn = db_conn
+    first = make_cve_item("CVE-2025-2222", 5.0, "MEDIUM", "AV:N/AC:L")
+    second = make_cve_item("CVE-2025-2222", 7.5, "HIGH", "AV:N/AC:L")
+    _process(conn, first)
+    result = _process(conn, second)
     assert result.change_count >= 1
     change = conn.execute(
-        "SELECT change_type, from_severity, to_severity FROM cve_changes"
+        "SELECT change_type, from_severity, to_severity FROM cve_changes WHERE cve_id = %s",
+        ("CVE-2025-2222",),
     ).fetchone()
     assert change[0] == "severity_upgrade"
     assert change[1] == "MEDIUM"
     assert change[2] == "HIGH"
 
 
-def test_vector_change_detection(tmp_path):
-    conn = init_db()
-    first = _make_cve_item("CVE-2025-3333", 5.0, "MEDIUM", "AV:N/AC:L")
-    second = _make_cve_item("CVE-2025-3333", 5.0, "MEDIUM", "AV:L/AC:L")
-    process_cve_item(conn, first, prefer_v4=True, filters={}, scope_min_cvss=None, watchlist_enabled=False)
-    process_cve_item(conn, second, prefer_v4=True, filters={}, scope_min_cvss=None, watchlist_enabled=False)
+def test_vector_change_detection(db_conn):
+    conn = db_conn
+    first = make_cve_item("CVE-2025-3333", 5.0, "MEDIUM", "AV:N/AC:L")
+    second = make_cve_item("CVE-2025-3333", 5.0, "MEDIUM", "AV:L/AC:L")
+    _process(conn, first)
+    _process(conn, second)
     change = conn.execute(
-        "SELECT change_type, vector_from, vector_to FROM cve_changes WHERE change_type = 'vector_change'"
+        "SELECT change_type, vector_from, vector_to FROM cve_changes "
+        "WHERE cve_id = %s AND change_type = 'vector_change'",
+        ("CVE-2025-3333",),
     ).fetchone()
     assert change is not None
     assert change[1] == "AV:N/AC:L"
     assert change[2] == "AV:L/AC:L"
 
 
-def test_preferred_severity_diff_on_v4_added(tmp_path):
-    conn = init_db()
-    first = _make_cve_item("CVE-2025-4444", 7.0, "HIGH", "AV:N/AC:L")
-    second = _make_cve_item(
+def test_preferred_severity_diff_on_v4_added(db_conn):
+    conn = db_conn
+    first = make_cve_item("CVE-2025-4444", 7.0, "HIGH", "AV:N/AC:L")
+    second = make_cve_item(
         "CVE-2025-4444",
         7.0,
         "HIGH",
@@ -114,28 +77,49 @@ def test_preferred_severity_diff_on_v4_added(tmp_path):
         v40_severity="CRITICAL",
         v40_vector="AV:N/AC:L/AT:N",
     )
-    process_cve_item(conn, first, prefer_v4=True, filters={}, scope_min_cvss=None, watchlist_enabled=False)
-    process_cve_item(conn, second, prefer_v4=True, filters={}, scope_min_cvss=None, watchlist_enabled=False)
+    _process(conn, first)
+    _process(conn, second)
     change_types = {
         row[0]
-        for row in conn.execute("SELECT change_type FROM cve_changes").fetchall()
+        for row in conn.execute(
+            "SELECT change_type FROM cve_changes WHERE cve_id = %s", ("CVE-2025-4444",)
+        ).fetchall()
     }
     assert "cvss_version_added" in change_types
     assert "preferred_severity_diff" in change_types
 
 
-def test_idempotent_rerun(tmp_path):
-    conn = init_db()
-    item = _make_cve_item("CVE-2025-5555", 4.0, "LOW", "AV:N/AC:L")
-    process_cve_item(conn, item, prefer_v4=True, filters={}, scope_min_cvss=None, watchlist_enabled=False)
-    process_cve_item(conn, item, prefer_v4=True, filters={}, scope_min_cvss=None, watchlist_enabled=False)
-    assert conn.execute("SELECT COUNT(*) FROM cve_snapshots").fetchone()[0] == 1
-    assert conn.execute("SELECT COUNT(*) FROM cve_changes").fetchone()[0] == 0
+def test_idempotent_rerun(db_conn):
+    conn = db_conn
+    item = make_cve_item("CVE-2025-5555", 4.0, "LOW", "AV:N/AC:L")
+    _process(conn, item)
+    _process(conn, item)
+    assert count_at_most(conn, "cve_snapshots", 1, "cve_id = %s", ("CVE-2025-5555",)) == 1
+    assert count_at_most(conn, "cve_changes", 0, "cve_id = %s", ("CVE-2025-5555",)) == 0
 
 
-def test_cve_sync_result_is_json_serializable(tmp_path, monkeypatch):
-    conn = init_db()
-    item = _make_cve_item("CVE-2025-6666", 6.0, "MEDIUM", "AV:N/AC:L")
+def test_unchanged_rerun_skips_snapshot_but_refreshes_cve(db_conn, monkeypatch):
+    conn = db_conn
+    item = make_cve_item("CVE-2025-5556", 4.0, "LOW", "AV:N/AC:L")
+    _process(conn, item)
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("unchanged CVE should not be snapshotted again")
+
+    monkeypatch.setattr(cve_sync, "insert_cve_snapshot", _fail)
+    updated = {**item, "descriptions": [{"lang": "en", "value": "Updated description"}]}
+    result = _process(conn, updated)
+    assert result.new_snapshot is False
+    assert result.change_count == 0
+    row = conn.execute(
+        "SELECT description_text FROM cves WHERE cve_id = %s", ("CVE-2025-5556",)
+    ).fetchone()
+    assert row[0] == "Updated description"
+
+
+def test_cve_sync_result_is_json_serializable(monkeypatch, db_conn):
+    conn = db_conn
+    item = make_cve_item("CVE-2025-6666", 6.0, "MEDIUM", "AV:N/AC:L")
 
     def _fake_fetch_page(config, last_modified_start, last_modified_end, start_index, cve_id=None):
         if start_index > 0:
@@ -169,13 +153,58 @@ def test_cve_sync_result_is_json_serializable(tmp_path, monkeypatch):
     assert complete_job(conn, job_id, result=result) is True
 
 
-def test_snapshot_hash_with_preferred_dict(tmp_path):
+def test_sync_cves_walks_all_pages_with_prefetch(monkeypatch):
+    pages = {
+        0: ["CVE-2025-0101", "CVE-2025-0102"],
+        2: ["CVE-2025-0103", "CVE-2025-0104"],
+        4: ["CVE-2025-0105"],
+    }
+    requested = []
+    seen = []
+
+    def _fake_fetch_page(config, last_modified_start, last_modified_end, start_index, cve_id=None):
+        requested.append(start_index)
+        items = [{"cve": {"id": value}} for value in pages[start_index]]
+        return {"vulnerabilities": items, "totalResults": 5, "resultsPerPage": 2}
+
+    def _fake_process(conn, cve_item, *_args):
+        seen.append(cve_item["id"])
+        return cve_sync.ProcessResult(new_snapshot=True, change_count=0)
+
+    monkeypatch.setattr(cve_sync, "_fetch_page", _fake_fetch_page)
+    monkeypatch.setattr(cve_sync, "process_cve_item", _fake_process)
+    monkeypatch.setattr(cve_sync, "set_setting", lambda *_args: None)
+    result = sync_cves(
+        None,
+        CveSyncConfig(
+            api_base="https://services.nvd.nist.gov/rest/json/cves/2.0",
+            results_per_page=2,
+            rate_limit_seconds=0.0,
+            backoff_seconds=0.0,
+            max_retries=0,
+            prefer_v4=True,
+            scope_min_cvss=None,
+            watchlist_enabled=False,
+            api_key=None,
+            filters={},
+        ),
+        last_modified_start="2025-01-01T00:00:00Z",
+        last_modified_end="2025-01-02T00:00:00Z",
+    )
+    assert requested == [0, 2, 4]
+    assert seen == [cve for start in (0, 2, 4) for cve in pages[start]]
+    assert result["processed"] == 5
+    assert result["errors"] == 0
+
+
+def test_snapshot_hash_with_preferred_dict(db_conn):
     metrics = PreferredMetrics(version="3.1", base_score=7.5, base_severity="HIGH", vector="AV:N")
-    payload = {"preferred": asdict(metrics), "v31": {"baseScore": 7.5}, "v40": None}
+    payload = {"preferred": _metrics_dict(metrics), "v31": {"baseScore": 7.5}, "v40": None}
+    assert payload["preferred"] == asdict(metrics)
     digest = _snapshot_hash(payload)
     assert isinstance(digest, str)
 
-    conn = init_db()
+    conn = db_conn
     inserted = insert_cve_snapshot(
         conn,
         cve_id="CVE-2025-7777",
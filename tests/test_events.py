@@ -1,5 +1,4 @@
 from sempervigil.storage import (
-    init_db,
     link_cve_product,
     upsert_cve,
     upsert_event_for_cve,
@@ -28,8 +27,8 @@ def _seed_cve(conn, cve_id: str, published_at: str) -> None:
     )
 
 
-def test_event_merge_shared_product(tmp_path):
-    conn = init_db()
+def test_event_merge_shared_product(db_conn):
+    conn = db_conn
     vendor_id = upsert_vendor(conn, "Acme")
     product_id, _ = upsert_product(conn, vendor_id, "Widget")
     now = utc_now_iso()
@@ -56,8 +55,8 @@ def test_event_merge_shared_product(tmp_path):
     assert event_id_one == event_id_two
 
 
-def test_event_separate_outside_window(tmp_path):
-    conn = init_db()
+def test_event_separate_outside_window(db_conn):
+    conn = db_conn
     vendor_id = upsert_vendor(conn, "Acme")
     product_id, _ = upsert_product(conn, vendor_id, "Widget")
     now = utc_now_iso()
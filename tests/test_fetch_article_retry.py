@@ -1,5 +1,3 @@
-import logging
-
 from sempervigil.storage import (
     init_db,
     enqueue_job,
@@ -8,45 +6,15 @@ from sempervigil.storage import (
 from sempervigil.worker import _handle_fetch_article_content
 from sempervigil.config import load_runtime_config
 
+from _factories import seed_articles
+from _helpers import QUIET_LOGGER
+
 
-def test_fetch_article_missing_url_fails(tmp_path, monkeypatch):
-    data_dir = tmp_path / "data"
-    monkeypatch.setenv("SV_DATA_DIR", str(data_dir))
+def test_fetch_article_missing_url_fails():
     conn = init_db()
     config = load_runtime_config(conn)
 
-    conn.execute(
-        """
-        INSERT INTO articles
-            (source_id, stable_id, original_url, normalized_url, title, published_at,
-             published_at_source, ingested_at, brief_day, is_commercial, content_fingerprint,
-             extracted_text_path, extracted_text_hash, raw_html_path, raw_html_hash,
-             meta_json, created_at, updated_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            "source-1",
-            "stable-1",
-            "",
-            "",
-            "Title",
-            None,
-            None,
-            "2025-01-01T00:00:00Z",
-            "2025-01-01",
-            0,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            "2025-01-01T00:00:00Z",
-            "2025-01-01T00:00:00Z",
-        ),
-    )
-    conn.commit()
-    article_id = conn.execute("SELECT id FROM articles").fetchone()[0]
+    [article_id] = seed_articles(conn, [""])
 
     enqueue_job(
         conn,
@@ -54,9 +22,8 @@ def test_fetch_article_missing_url_fails(tmp_path, monkeypatch):
         {"article_id": article_id, "source_id": "source-1"},
     )
     job = claim_next_job(conn, "worker-1", allowed_types=["fetch_article_content"])
-    logger = logging.getLogger("test")
-    result = _handle_fetch_article_content(conn, config, job, job.payload, logger=logger)
+    result = _handle_fetch_article_content(conn, config, job, job.payload, logger=QUIET_LOGGER)
     assert result["requeued"] is True
     assert result["reason"] == "article_url_missing"
-    row = conn.execute("SELECT status FROM jobs WHERE id = ?", (job.id,)).fetchone()
+    row = conn.execute("SELECT status FROM jobs WHERE id = %s", (job.id,)).fetchone()
     assert row[0] == "queued"
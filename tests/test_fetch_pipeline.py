@@ -1,50 +1,38 @@
-import logging
+from uuid import uuid4
+
+import pytest
 
 from sempervigil.config import load_runtime_config
 from sempervigil.storage import claim_next_job, enqueue_job, init_db
 from sempervigil.services import ai_service
 from sempervigil import worker
 
+from _factories import seed_articles
+from _helpers import QUIET_LOGGER
+
 
-def _insert_article(conn, url: str):
-    conn.execute(
+def _has_job(conn, job_type: str, article_id: int) -> bool:
+    row = conn.execute(
         """
-        INSERT INTO articles
-            (source_id, stable_id, original_url, normalized_url, title, published_at,
-             published_at_source, ingested_at, brief_day, is_commercial, content_fingerprint,
-             extracted_text_path, extracted_text_hash, raw_html_path, raw_html_hash,
-             meta_json, created_at, updated_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        SELECT 1 FROM jobs
+        WHERE job_type = %s AND payload_json::jsonb ->> 'article_id' = %s
+        LIMIT 1
         """,
-        (
-            "source-1",
-            "stable-1",
-            url,
-            url,
-            "Title",
-            None,
-            None,
-            "2025-01-01T00:00:00Z",
-            "2025-01-01",
-            0,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            "2025-01-01T00:00:00Z",
-            "2025-01-01T00:00:00Z",
-        ),
-    )
-    conn.commit()
-    return conn.execute("SELECT id FROM articles").fetchone()[0]
-
-
-def _seed_summarize_profile(conn):
+        (job_type, str(article_id)),
+    ).fetchone()
+    return row is not None
+
+
+@pytest.fixture(scope="module")
+def _summarize_profile(_shared_conn):
+    # Provider, model, prompt and profile rows are only read by these tests,
+    # so create them once per module. Other tests commit their own "Test
+    # Provider" rows, so these names carry a per-run suffix.
+    conn = _shared_conn
+    suffix = uuid4().hex[:8]
     provider = ai_service.create_provider(
         conn,
-        {"name": "Test Provider", "type": "openai_compatible", "is_enabled": True},
+        {"name": f"Test Provider {suffix}", "type": "openai_compatible", "is_enabled": True},
     )
     model = ai_service.create_model(
         conn,
@@ -57,7 +45,7 @@ def _seed_summarize_profile(conn):
     prompt = ai_service.create_prompt(
         conn,
         {
-            "name": "Summarize",
+            "name": f"Summarize {suffix}",
             "version": "v1",
             "system_template": "{{input}}",
             "user_template": "{{input}}",
@@ -66,27 +54,34 @@ def _seed_summarize_profile(conn):
     profile = ai_service.create_profile(
         conn,
         {
-            "name": "Summarize Profile",
+            "name": f"Summarize Profile {suffix}",
             "primary_provider_id": provider["id"],
             "primary_model_id": model["id"],
             "prompt_id": prompt["id"],
             "is_enabled": True,
         },
     )
-    ai_service.set_pipeline_routing(conn, "summarize_article", profile["id"])
-    return profile
+    yield profile
+    ai_service.delete_profile(conn, profile["id"])
+    ai_service.delete_prompt(conn, prompt["id"])
+    ai_service.delete_provider(conn, provider["id"])
+
+
+@pytest.fixture
+def summarize_routing(_shared_conn, _summarize_profile):
+    ai_service.set_pipeline_routing(_shared_conn, "summarize_article", _summarize_profile["id"])
+    yield _summarize_profile
+    _shared_conn.execute("DELETE FROM pipeline_stage_config WHERE stage_name = %s", ("summarize_article",))
+    _shared_conn.commit()
 
 
-def test_fetch_enqueues_summarize_when_llm_configured(tmp_path, monkeypatch):
-    data_dir = tmp_path / "data"
-    monkeypatch.setenv("SV_DATA_DIR", str(data_dir))
+def test_fetch_enqueues_summarize_when_llm_configured(monkeypatch, summarize_routing):
     monkeypatch.setenv("SV_LLM_BASE_URL", "http://llm")
     monkeypatch.setenv("SV_LLM_API_KEY", "sk-test")
     conn = init_db()
     config = load_runtime_config(conn)
-    _seed_summarize_profile(conn)
 
-    article_id = _insert_article(conn, "https://example.com/a")
+    [article_id] = seed_articles(conn, ["https://example.com/a"])
     enqueue_job(conn, "fetch_article_content", {"article_id": article_id, "source_id": "source-1"})
     job = claim_next_job(conn, "worker-1", allowed_types=["fetch_article_content"])
 
@@ -94,22 +89,17 @@ def test_fetch_enqueues_summarize_when_llm_configured(tmp_path, monkeypatch):
         return {"content_text": "content", "content_html": "<p>content</p>"}
 
     monkeypatch.setattr(worker, "fetch_article_content", _fake_fetch)
-    logger = logging.getLogger("test")
-    worker._handle_fetch_article_content(conn, config, job, job.payload, logger=logger)
+    worker._handle_fetch_article_content(conn, config, job, job.payload, logger=QUIET_LOGGER)
 
-    rows = conn.execute("SELECT job_type FROM jobs").fetchall()
-    types = [row[0] for row in rows]
-    assert "summarize_article_llm" in types
-    assert "write_article_markdown" not in types
+    assert _has_job(conn, "summarize_article_llm", article_id) is True
+    assert _has_job(conn, "write_article_markdown", article_id) is False
 
 
-def test_fetch_enqueues_publish_when_llm_disabled(tmp_path, monkeypatch):
-    data_dir = tmp_path / "data"
-    monkeypatch.setenv("SV_DATA_DIR", str(data_dir))
+def test_fetch_enqueues_publish_when_llm_disabled(monkeypatch):
     conn = init_db()
     config = load_runtime_config(conn)
 
-    article_id = _insert_article(conn, "https://example.com/b")
+    [article_id] = seed_articles(conn, ["https://example.com/b"])
     enqueue_job(conn, "fetch_article_content", {"article_id": article_id, "source_id": "source-1"})
     job = claim_next_job(conn, "worker-1", allowed_types=["fetch_article_content"])
 
@@ -117,33 +107,24 @@ def test_fetch_enqueues_publish_when_llm_disabled(tmp_path, monkeypatch):
         return {"content_text": "content", "content_html": "<p>content</p>"}
 
     monkeypatch.setattr(worker, "fetch_article_content", _fake_fetch)
-    logger = logging.getLogger("test")
-    worker._handle_fetch_article_content(conn, config, job, job.payload, logger=logger)
+    worker._handle_fetch_article_content(conn, config, job, job.payload, logger=QUIET_LOGGER)
 
-    rows = conn.execute("SELECT job_type FROM jobs").fetchall()
-    types = [row[0] for row in rows]
-    assert "write_article_markdown" in types
+    assert _has_job(conn, "write_article_markdown", article_id) is True
 
 
-def test_summarize_enqueues_publish(tmp_path, monkeypatch):
-    data_dir = tmp_path / "data"
-    monkeypatch.setenv("SV_DATA_DIR", str(data_dir))
+def test_summarize_enqueues_publish(monkeypatch, summarize_routing):
     monkeypatch.setenv("SV_LLM_BASE_URL", "http://llm")
     monkeypatch.setenv("SV_LLM_API_KEY", "sk-test")
     conn = init_db()
     config = load_runtime_config(conn)
-    _seed_summarize_profile(conn)
-    article_id = _insert_article(conn, "https://example.com/c")
+    [article_id] = seed_articles(conn, ["https://example.com/c"])
 
     def _fake_summarize(**_kwargs):
         return {"summary": "short", "model": "test"}
 
     monkeypatch.setattr(worker, "summarize_with_llm", _fake_summarize)
-    logger = logging.getLogger("test")
     worker._handle_summarize_article_llm(
-        conn, config, {"article_id": article_id, "source_id": "source-1"}, logger=logger
+        conn, config, {"article_id": article_id, "source_id": "source-1"}, logger=QUIET_LOGGER
     )
 
-    rows = conn.execute("SELECT job_type FROM jobs").fetchall()
-    types = [row[0] for row in rows]
-    assert "write_article_markdown" in types
+    assert _has_job(conn, "write_article_markdown", article_id) is True
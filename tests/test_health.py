@@ -1,6 +1,6 @@
-from sempervigil.storage import get_source, init_db, record_source_run, upsert_source
+from sempervigil.storage import get_source, record_source_run, set_setting, upsert_source
 from sempervigil.worker import _maybe_pause_source
-from sempervigil.utils import utc_now_iso, utc_now_iso_offset
+from sempervigil.utils import utc_now_iso_offset
 
 
 def _seed_source(conn, source_id: str) -> None:
@@ -16,116 +16,93 @@ def _seed_source(conn, source_id: str) -> None:
     )
 
 
-def test_auto_pause_on_error_streak(tmp_path):
-    conn = init_db()
-    _seed_source(conn, "source-1")
+def _run(source_id: str, seconds_ago: int, status: str, http_status=None, items_found=0, error=None):
+    return {
+        "source_id": source_id,
+        "started_at": utc_now_iso_offset(seconds=-seconds_ago),
+        "finished_at": utc_now_iso_offset(seconds=1 - seconds_ago),
+        "status": status,
+        "http_status": http_status,
+        "items_found": items_found,
+        "items_accepted": 0,
+        "skipped_duplicates": 0,
+        "skipped_filters": 0,
+        "skipped_missing_url": 0,
+        "error": error,
+        "notes": None,
+    }
+
+
+def _set_settings(conn, values) -> None:
+    for key, value in values.items():
+        set_setting(conn, key, value)
 
-    conn.execute(
-        "INSERT INTO settings (key, value, updated_at) VALUES (?, ?, ?)",
-        ("alerts.pause_on_failure.error_streak", "2", utc_now_iso()),
-    )
-    conn.execute(
-        "INSERT INTO settings (key, value, updated_at) VALUES (?, ?, ?)",
-        ("alerts.pause_on_failure.pause_minutes", "60", utc_now_iso()),
-    )
-    conn.commit()
 
-    record_source_run(
+def _record_runs(conn, runs) -> None:
+    for run in runs:
+        record_source_run(conn, **run)
+
+
+def test_auto_pause_on_error_streak(db_conn):
+    conn = db_conn
+    _seed_source(conn, "health-error-source")
+
+    _set_settings(
         conn,
-        source_id="source-1",
-        started_at=utc_now_iso_offset(seconds=-10),
-        finished_at=utc_now_iso_offset(seconds=-9),
-        status="error",
-        http_status=None,
-        items_found=0,
-        items_accepted=0,
-        skipped_duplicates=0,
-        skipped_filters=0,
-        skipped_missing_url=0,
-        error="boom",
-        notes=None,
+        {
+            "alerts.pause_on_failure.error_streak": 2,
+            "alerts.pause_on_failure.pause_minutes": 60,
+        },
     )
-    record_source_run(
+
+    _record_runs(
         conn,
-        source_id="source-1",
-        started_at=utc_now_iso_offset(seconds=-5),
-        finished_at=utc_now_iso_offset(seconds=-4),
-        status="error",
-        http_status=None,
-        items_found=0,
-        items_accepted=0,
-        skipped_duplicates=0,
-        skipped_filters=0,
-        skipped_missing_url=0,
-        error="boom",
-        notes=None,
+        [
+            _run("health-error-source", 10, "error", error="boom"),
+            _run("health-error-source", 5, "error", error="boom"),
+        ],
     )
 
-    _maybe_pause_source(conn, "source-1", logger=None)
-    source = get_source(conn, "source-1")
+    _maybe_pause_source(conn, "health-error-source", logger=None)
+    source = get_source(conn, "health-error-source")
     assert source is not None
     assert source.enabled is False
     assert source.pause_until is not None
     assert "error_streak" in (source.paused_reason or "")
     alert = conn.execute(
-        "SELECT alert_type FROM health_alerts WHERE source_id = ?",
-        ("source-1",),
+        "SELECT alert_type FROM health_alerts WHERE source_id = %s",
+        ("health-error-source",),
     ).fetchone()
     assert alert is not None
 
 
-def test_auto_pause_on_zero_streak(tmp_path):
-    conn = init_db()
-    _seed_source(conn, "source-2")
-
-    conn.execute(
-        "INSERT INTO settings (key, value, updated_at) VALUES (?, ?, ?)",
-        ("alerts.pause_on_failure.zero_streak", "2", utc_now_iso()),
-    )
-    conn.execute(
-        "INSERT INTO settings (key, value, updated_at) VALUES (?, ?, ?)",
-        ("alerts.pause_on_failure.pause_minutes", "60", utc_now_iso()),
-    )
-    conn.commit()
+def test_auto_pause_on_zero_streak(db_conn):
+    conn = db_conn
+    _seed_source(conn, "health-zero-source")
 
-    record_source_run(
+    _set_settings(
         conn,
-        source_id="source-2",
-        started_at=utc_now_iso_offset(seconds=-10),
-        finished_at=utc_now_iso_offset(seconds=-9),
-        status="ok",
-        http_status=200,
-        items_found=5,
-        items_accepted=0,
-        skipped_duplicates=0,
-        skipped_filters=0,
-        skipped_missing_url=0,
-        error=None,
-        notes=None,
+        {
+            "alerts.pause_on_failure.zero_streak": 2,
+            "alerts.pause_on_failure.pause_minutes": 60,
+        },
     )
-    record_source_run(
+
+    _record_runs(
         conn,
-        source_id="source-2",
-        started_at=utc_now_iso_offset(seconds=-5),
-        finished_at=utc_now_iso_offset(seconds=-4),
-        status="ok",
-        http_status=200,
-        items_found=3,
-        items_accepted=0,
-        skipped_duplicates=0,
-        skipped_filters=0,
-        skipped_missing_url=0,
-        error=None,
-        notes=None,
+        [
+            _run("health-zero-source", 10, "ok", http_status=200, items_found=5),
+            _run("health-zero-source", 5, "ok", http_status=200, items_found=3),
+        ],
     )
 
-    _maybe_pause_source(conn, "source-2", logger=None)
-    source = get_source(conn, "source-2")
+    _maybe_pause_source(conn, "health-zero-source", logger=None)
+    source = get_source(conn, "health-zero-source")
     assert source is not None
     assert source.enabled is False
     assert "zero_streak" in (source.paused_reason or "")
     alert = conn.execute(
-        "SELECT alert_type FROM health_alerts WHERE source_id = ?",
-        ("source-2",),
+        "SELECT alert_type FROM health_alerts WHERE source_id = %s",
+        ("health-zero-source",),
     ).fetchone()
     assert alert is not None
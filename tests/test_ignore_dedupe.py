@@ -1,21 +1,21 @@
-import copy
-
-from sempervigil.config import DEFAULT_CONFIG, load_runtime_config, set_runtime_config
+from sempervigil.config import load_runtime_config, set_runtime_config
 from sempervigil.ingest import evaluate_entry
-from sempervigil.models import Article, Source
-from sempervigil.storage import init_db, insert_articles
+from sempervigil.models import Article
+from sempervigil.storage import insert_articles
 from sempervigil.utils import stable_id_from_url
 
+from _factories import make_source
+from _helpers import default_config
+
 
-def _make_config(tmp_path):
-    conn = init_db()
-    set_runtime_config(conn, copy.deepcopy(DEFAULT_CONFIG))
+def _make_config(conn):
+    set_runtime_config(conn, default_config())
     return load_runtime_config(conn)
 
 
-def test_ignore_dedupe_accepts_duplicate(tmp_path):
-    config = _make_config(tmp_path)
-    conn = init_db()
+def test_ignore_dedupe_accepts_duplicate(db_conn):
+    conn = db_conn
+    config = _make_config(conn)
 
     url = "https://example.com/item"
     article_id = stable_id_from_url(url)
@@ -38,17 +38,7 @@ def test_ignore_dedupe_accepts_duplicate(tmp_path):
         ],
     )
 
-    source = Source(
-        id="s1",
-        name="Source",
-        enabled=True,
-        base_url="https://example.com",
-        topic_key=None,
-        default_frequency_minutes=60,
-        pause_until=None,
-        paused_reason=None,
-        robots_notes=None,
-    )
+    source = make_source()
     entry = {"title": "Existing", "link": url}
 
     decision, _ = evaluate_entry(
@@ -77,9 +67,9 @@ def test_ignore_dedupe_accepts_duplicate(tmp_path):
     assert "already_seen" in decision.reasons
 
 
-def test_ignore_dedupe_counts_preview(tmp_path):
-    config = _make_config(tmp_path)
-    conn = init_db()
+def test_ignore_dedupe_counts_preview(db_conn):
+    conn = db_conn
+    config = _make_config(conn)
 
     url = "https://example.com/item"
     article_id = stable_id_from_url(url)
@@ -102,17 +92,7 @@ def test_ignore_dedupe_counts_preview(tmp_path):
         ],
     )
 
-    source = Source(
-        id="s1",
-        name="Source",
-        enabled=True,
-        base_url="https://example.com",
-        topic_key=None,
-        default_frequency_minutes=60,
-        pause_until=None,
-        paused_reason=None,
-        robots_notes=None,
-    )
+    source = make_source()
     entry = {"title": "Existing", "link": url}
     decision, article = evaluate_entry(
         entry,
@@ -1,34 +1,22 @@
-import copy
+from sempervigil.config import load_runtime_config, set_runtime_config
+from sempervigil.ingest import _keyword_match, evaluate_entry
 
-from sempervigil.config import DEFAULT_CONFIG, load_runtime_config, set_runtime_config
-from sempervigil.ingest import evaluate_entry
-from sempervigil.models import Source
-from sempervigil.storage import init_db
+from _factories import make_source
+from _helpers import default_config
 
 
-def _make_config(tmp_path, deny_keywords=None):
-    payload = copy.deepcopy(DEFAULT_CONFIG)
+def _make_config(conn, deny_keywords=None):
+    payload = default_config()
     if deny_keywords is not None:
         payload["ingest"]["filters"]["deny_keywords"] = deny_keywords
-    conn = init_db()
     set_runtime_config(conn, payload)
     return load_runtime_config(conn)
 
 
-def test_decision_missing_url(tmp_path):
-    config = _make_config(tmp_path)
-    conn = init_db()
-    source = Source(
-        id="s1",
-        name="Source",
-        enabled=True,
-        base_url="https://example.com",
-        topic_key=None,
-        default_frequency_minutes=60,
-        pause_until=None,
-        paused_reason=None,
-        robots_notes=None,
-    )
+def test_decision_missing_url(db_conn):
+    conn = db_conn
+    config = _make_config(conn)
+    source = make_source()
     entry = {"title": "No link"}
 
     decision, article = evaluate_entry(
@@ -46,20 +34,10 @@ def test_decision_missing_url(tmp_path):
     assert article is None
 
 
-def test_decision_deny_keyword(tmp_path):
-    config = _make_config(tmp_path, deny_keywords=["blocked"])
-    conn = init_db()
-    source = Source(
-        id="s1",
-        name="Source",
-        enabled=True,
-        base_url="https://example.com",
-        topic_key=None,
-        default_frequency_minutes=60,
-        pause_until=None,
-        paused_reason=None,
-        robots_notes=None,
-    )
+def test_decision_deny_keyword(db_conn):
+    conn = db_conn
+    config = _make_config(conn, deny_keywords=["blocked"])
+    source = make_source()
     entry = {"title": "Blocked item", "link": "https://example.com/1"}
 
     decision, article = evaluate_entry(
@@ -75,3 +53,10 @@ def test_decision_deny_keyword(tmp_path):
     assert decision.decision == "SKIP"
     assert any(reason.startswith("deny_keywords") for reason in decision.reasons)
     assert article is None
+
+
+def test_keyword_match_reports_every_overlapping_keyword():
+    keywords = ["Ransomware", "ransom", "phishing"]
+    assert _keyword_match("New RANSOMWARE strain", keywords) == ["Ransomware", "ransom"]
+    assert _keyword_match("Patch Tuesday roundup", keywords) == []
+    assert _keyword_match("anything", []) == []
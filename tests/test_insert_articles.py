@@ -0,0 +1,22 @@
+from sempervigil.storage import get_article_ids, insert_articles, upsert_source
+
+from _factories import build_article
+
+
+def test_insert_articles_tags_every_row_from_generator(db_conn):
+    conn = db_conn
+    upsert_source(conn, {"id": "source-1", "name": "Example", "enabled": True})
+    articles = [
+        build_article(stable_id=f"generator-{idx}", tags=[f"tag-{idx}", "shared"])
+        for idx in range(3)
+    ]
+
+    assert insert_articles(conn, (article for article in articles)) == 3
+
+    ids = get_article_ids(conn, [(a.source_id, a.stable_id) for a in articles])
+    rows = conn.execute(
+        "SELECT tag FROM article_tags WHERE article_id = ANY(%s)",
+        (list(ids.values()),),
+    ).fetchall()
+    assert len(rows) == 6
+    assert {row[0] for row in rows} == {"tag-0", "tag-1", "tag-2", "shared"}
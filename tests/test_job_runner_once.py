@@ -1,8 +1,8 @@
-from sempervigil.storage import claim_next_job, complete_job, enqueue_job, init_db, list_jobs
+from sempervigil.storage import claim_next_job, complete_job, enqueue_job, list_jobs
 
 
-def test_job_runner_claims_one_job_fifo(tmp_path):
-    conn = init_db()
+def test_job_runner_claims_one_job_fifo(empty_job_queue):
+    conn = empty_job_queue
     first = enqueue_job(conn, "test_source", {"source_id": "a"})
     second = enqueue_job(conn, "test_source", {"source_id": "b"})
 
@@ -2,13 +2,17 @@ from sempervigil.storage import (
     claim_next_job,
     complete_job,
     enqueue_job,
+    enqueue_jobs_bulk,
+    enqueue_source_jobs,
     init_db,
     list_jobs,
 )
 from sempervigil.utils import utc_now_iso_offset
 
 
-def test_enqueue_and_claim_job(tmp_path):
+def test_enqueue_and_claim_job():
+    # Two real connections: the job must be committed for the second
+    # worker to see (and fail to claim) it.
     conn = init_db()
     conn2 = init_db()
 
@@ -23,8 +27,8 @@ def test_enqueue_and_claim_job(tmp_path):
     assert second is None
 
 
-def test_debounce_build_job(tmp_path):
-    conn = init_db()
+def test_debounce_build_job(empty_job_queue):
+    conn = empty_job_queue
 
     first = enqueue_job(conn, "build_site", None, debounce=True)
     claimed = claim_next_job(conn, "worker-1")
@@ -37,8 +41,8 @@ def test_debounce_build_job(tmp_path):
     assert first == second
 
 
-def test_job_lifecycle_records_result(tmp_path):
-    conn = init_db()
+def test_job_lifecycle_records_result(empty_job_queue):
+    conn = empty_job_queue
 
     job_id = enqueue_job(conn, "test_source", {"source_id": "cisa-alerts"})
     claimed = claim_next_job(conn, "worker-1")
@@ -54,8 +58,8 @@ def test_job_lifecycle_records_result(tmp_path):
     assert jobs[0].result == result
 
 
-def test_stale_lock_requeues_job(tmp_path):
-    conn = init_db()
+def test_stale_lock_requeues_job(empty_job_queue):
+    conn = empty_job_queue
 
     job_id = enqueue_job(conn, "build_site", None)
     claimed = claim_next_job(conn, "worker-1")
@@ -63,7 +67,7 @@ def test_stale_lock_requeues_job(tmp_path):
 
     stale_time = utc_now_iso_offset(seconds=-3600)
     conn.execute(
-        "UPDATE jobs SET locked_at = ?, status = 'running' WHERE id = ?",
+        "UPDATE jobs SET locked_at = %s, status = 'running' WHERE id = %s",
         (stale_time, job_id),
     )
     conn.commit()
@@ -71,3 +75,31 @@ def test_stale_lock_requeues_job(tmp_path):
     reclaimed = claim_next_job(conn, "worker-2", lock_timeout_seconds=10)
     assert reclaimed is not None
     assert reclaimed.id == job_id
+
+
+def test_enqueue_source_jobs_skips_already_queued(db_conn):
+    conn = db_conn
+
+    enqueue_job(conn, "ingest_source", {"source_id": "src-a"})
+    enqueued = enqueue_source_jobs(conn, "ingest_source", ["src-a", "src-b", "src-b"])
+    assert enqueued == ["src-b"]
+
+    again = enqueue_source_jobs(conn, "ingest_source", ["src-a", "src-b"])
+    assert again == []
+
+
+def test_enqueue_jobs_bulk(db_conn):
+    conn = db_conn
+
+    job_ids = enqueue_jobs_bulk(
+        conn,
+        [
+            ("write_article_markdown", {"article_id": 1}),
+            ("fetch_article_content", {"article_id": 2}),
+        ],
+    )
+    assert len(job_ids) == 2
+    jobs = {job.id: job for job in list_jobs(conn, limit=10)}
+    assert jobs[job_ids[0]].job_type == "write_article_markdown"
+    assert jobs[job_ids[1]].payload == {"article_id": 2}
+    assert enqueue_jobs_bulk(conn, []) == []
@@ -2,7 +2,7 @@ import logging
 import os
 import sys
 
-from sempervigil.utils import configure_logging
+from sempervigil.utils import configure_logging, log_event
 
 
 def test_configure_logging_idempotent(tmp_path, monkeypatch):
@@ -22,6 +22,7 @@ def test_configure_logging_idempotent(tmp_path, monkeypatch):
             handler
             for handler in root.handlers
             if isinstance(handler, logging.StreamHandler)
+            and not isinstance(handler, logging.FileHandler)
         ]
         file_handlers = [
             handler for handler in root.handlers if isinstance(handler, logging.FileHandler)
@@ -36,3 +37,35 @@ def test_configure_logging_idempotent(tmp_path, monkeypatch):
     finally:
         root.handlers = original_handlers
         root.setLevel(original_level)
+
+
+def test_configure_logging_keeps_existing_file_handler(tmp_path, monkeypatch):
+    log_file = tmp_path / "app.log"
+    monkeypatch.setenv("SV_LOG_FILE", str(log_file))
+
+    root = logging.getLogger()
+    original_handlers = list(root.handlers)
+    file_handler = logging.FileHandler(log_file)
+    try:
+        root.handlers = [file_handler]
+        configure_logging("sempervigil.hugo")
+
+        assert root.handlers[0] is file_handler
+        assert sum(isinstance(h, logging.FileHandler) for h in root.handlers) == 1
+    finally:
+        file_handler.close()
+        root.handlers = original_handlers
+
+
+def test_log_event_skips_filtered_levels():
+    class _Value:
+        formatted = 0
+
+        def __str__(self):
+            _Value.formatted += 1
+            return "value"
+
+    logger = logging.getLogger("sempervigil.test.filtered")
+    logger.setLevel(logging.WARNING)
+    log_event(logger, logging.INFO, "ignored", field=_Value())
+    assert _Value.formatted == 0
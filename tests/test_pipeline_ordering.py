@@ -1,26 +1,10 @@
-import copy
-import logging
-
-from sempervigil.config import DEFAULT_CONFIG, load_runtime_config, set_runtime_config
+from sempervigil.config import load_runtime_config
 from sempervigil.ingest import SourceResult
 from sempervigil.models import Article
-from sempervigil.storage import init_db, upsert_source
+from sempervigil.storage import get_article_id, upsert_source
 from sempervigil import worker
 
-
-def _seed_runtime_config(tmp_path, monkeypatch):
-    data_dir = tmp_path / "data"
-    monkeypatch.setenv("SV_DATA_DIR", str(data_dir))
-    conn = init_db()
-    config = copy.deepcopy(DEFAULT_CONFIG)
-    config["paths"]["data_dir"] = str(data_dir)
-    config["paths"]["output_dir"] = str(tmp_path / "site" / "content" / "posts")
-    config["paths"]["run_reports_dir"] = str(data_dir / "reports")
-    config["publishing"]["json_index_path"] = str(
-        tmp_path / "site" / "static" / "sempervigil" / "index.json"
-    )
-    set_runtime_config(conn, config)
-    return conn
+from _helpers import QUIET_LOGGER
 
 
 def _seed_source(conn):
@@ -37,6 +21,16 @@ def _seed_source(conn):
     )
 
 
+def _job_types_for(conn, article: Article) -> list[str]:
+    # seeded_conn tests commit, so other tests' jobs may still be queued.
+    article_id = get_article_id(conn, article.source_id, article.stable_id)
+    rows = conn.execute(
+        "SELECT job_type FROM jobs WHERE payload_json::jsonb ->> 'article_id' = %s",
+        (str(article_id),),
+    ).fetchall()
+    return [row[0] for row in rows]
+
+
 def _stub_result(article: Article) -> SourceResult:
     return SourceResult(
         source_id=article.source_id,
@@ -56,8 +50,8 @@ def _stub_result(article: Article) -> SourceResult:
     )
 
 
-def test_ingest_does_not_enqueue_publish_when_fetch_enabled(tmp_path, monkeypatch):
-    conn = _seed_runtime_config(tmp_path, monkeypatch)
+def test_ingest_does_not_enqueue_publish_when_fetch_enabled(monkeypatch, seeded_conn):
+    conn = seeded_conn
     _seed_source(conn)
     config = load_runtime_config(conn)
     article = Article(
@@ -78,17 +72,16 @@ def test_ingest_does_not_enqueue_publish_when_fetch_enabled(tmp_path, monkeypatc
         return _stub_result(article)
 
     monkeypatch.setattr(worker, "process_source", _fake_process_source)
-    logger = logging.getLogger("test")
-    worker._handle_ingest_source(conn, config, {"source_id": "source-1"}, logger)
+    monkeypatch.setattr(worker, "write_json_index", lambda *_args: None)
+    worker._handle_ingest_source(conn, config, {"source_id": "source-1"}, QUIET_LOGGER)
 
-    rows = conn.execute("SELECT job_type FROM jobs").fetchall()
-    types = [row[0] for row in rows]
+    types = _job_types_for(conn, article)
     assert "fetch_article_content" in types
     assert "write_article_markdown" not in types
 
 
-def test_ingest_enqueues_publish_when_fetch_disabled(tmp_path, monkeypatch):
-    conn = _seed_runtime_config(tmp_path, monkeypatch)
+def test_ingest_enqueues_publish_when_fetch_disabled(monkeypatch, seeded_conn):
+    conn = seeded_conn
     _seed_source(conn)
     config = load_runtime_config(conn)
     monkeypatch.setenv("SV_FETCH_FULL_CONTENT", "0")
@@ -110,9 +103,8 @@ def test_ingest_enqueues_publish_when_fetch_disabled(tmp_path, monkeypatch):
         return _stub_result(article)
 
     monkeypatch.setattr(worker, "process_source", _fake_process_source)
-    logger = logging.getLogger("test")
-    worker._handle_ingest_source(conn, config, {"source_id": "source-1"}, logger)
+    monkeypatch.setattr(worker, "write_json_index", lambda *_args: None)
+    worker._handle_ingest_source(conn, config, {"source_id": "source-1"}, QUIET_LOGGER)
 
-    rows = conn.execute("SELECT job_type FROM jobs").fetchall()
-    types = [row[0] for row in rows]
+    types = _job_types_for(conn, article)
     assert "write_article_markdown" in types
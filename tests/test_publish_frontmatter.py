@@ -5,12 +5,15 @@ import yaml
 from sempervigil.models import Article
 from sempervigil.publish import write_hugo_markdown
 
+# The frontmatter is emitted with libyaml when available; read it back the same way.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def _extract_frontmatter(path):
     content = path.read_text(encoding="utf-8")
     parts = content.split("---\n")
     assert len(parts) >= 3
-    return yaml.safe_load(parts[1])
+    return yaml.load(parts[1], Loader=_YAML_LOADER)
 
 
 def test_frontmatter_uses_source_url(tmp_path):
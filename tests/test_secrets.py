@@ -2,8 +2,29 @@ import base64
 
 import pytest
 
+from sempervigil.security import secrets
 from sempervigil.security.secrets import decrypt_secret, encrypt_secret
 
+_REAL_HKDF = secrets.HKDF
+_DERIVED: dict[bytes, bytes] = {}
+
+
+class _MemoHKDF:
+    # Every encrypt/decrypt call loads the box and re-derives the key; the
+    # tests only ever use a couple of master keys, so derive each one once.
+    def __init__(self, **kwargs) -> None:
+        self._kwargs = kwargs
+
+    def derive(self, key_material: bytes) -> bytes:
+        if key_material not in _DERIVED:
+            _DERIVED[key_material] = _REAL_HKDF(**self._kwargs).derive(key_material)
+        return _DERIVED[key_material]
+
+
+@pytest.fixture(autouse=True)
+def _memo_hkdf(monkeypatch):
+    monkeypatch.setattr(secrets, "HKDF", _MemoHKDF)
+
 
 def _set_master_env(monkeypatch):
     key = base64.urlsafe_b64encode(b"a" * 32).decode("utf-8")
@@ -1,28 +1,12 @@
-import copy
-import logging
-
 from sempervigil import worker
-from sempervigil.config import DEFAULT_CONFIG, load_runtime_config, set_runtime_config
-from sempervigil.storage import enqueue_job, get_job, init_db, upsert_source
-
+from sempervigil.config import load_runtime_config
+from sempervigil.storage import enqueue_job, get_job, upsert_source
 
-def _seed_runtime_config(tmp_path, monkeypatch):
-    data_dir = tmp_path / "data"
-    monkeypatch.setenv("SV_DATA_DIR", str(data_dir))
-    conn = init_db()
-    config = copy.deepcopy(DEFAULT_CONFIG)
-    config["paths"]["data_dir"] = str(data_dir)
-    config["paths"]["output_dir"] = str(tmp_path / "site" / "content" / "posts")
-    config["paths"]["run_reports_dir"] = str(data_dir / "reports")
-    config["publishing"]["json_index_path"] = str(
-        tmp_path / "site" / "static" / "sempervigil" / "index.json"
-    )
-    set_runtime_config(conn, config)
-    return conn
+from _helpers import QUIET_LOGGER
 
 
-def test_smoke_test_uses_jobs_not_direct_writer(tmp_path, monkeypatch):
-    conn = _seed_runtime_config(tmp_path, monkeypatch)
+def test_smoke_test_uses_jobs_not_direct_writer(monkeypatch, seeded_conn):
+    conn = seeded_conn
     upsert_source(
         conn,
         {
@@ -65,7 +49,6 @@ def test_smoke_test_uses_jobs_not_direct_writer(tmp_path, monkeypatch):
     monkeypatch.setattr(worker, "_run_jobs_inline", _noop_inline)
     monkeypatch.setattr(worker, "write_article_markdown", _writer_called)
 
-    logger = logging.getLogger("test")
-    result = worker._handle_smoke_test(conn, config, job, logger)
+    result = worker._handle_smoke_test(conn, config, job, QUIET_LOGGER)
     assert result["steps"][0]["step"] == "ingest_sources"
     assert calls["inline"] >= 1
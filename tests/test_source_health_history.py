@@ -1,36 +1,9 @@
-import copy
+from sempervigil.storage import insert_source_health_event, upsert_source
 
-from fastapi.testclient import TestClient
 
-from sempervigil.admin import app
-from sempervigil.config import DEFAULT_CONFIG, set_runtime_config
-from sempervigil.storage import init_db, insert_source_health_event
-
-
-def _seed_runtime_config(tmp_path, monkeypatch):
-    data_dir = tmp_path / "data"
-    monkeypatch.setenv("SV_DATA_DIR", str(data_dir))
-    conn = init_db()
-    config = copy.deepcopy(DEFAULT_CONFIG)
-    config["paths"]["data_dir"] = str(data_dir)
-    config["paths"]["output_dir"] = str(tmp_path / "site" / "content" / "posts")
-    config["paths"]["run_reports_dir"] = str(data_dir / "reports")
-    config["publishing"]["json_index_path"] = str(
-        tmp_path / "site" / "static" / "sempervigil" / "index.json"
-    )
-    set_runtime_config(conn, config)
-
-
-def test_source_health_history_endpoint(tmp_path, monkeypatch):
-    _seed_runtime_config(tmp_path, monkeypatch)
-    client = TestClient(app)
-
-    conn = init_db()
-    conn.execute(
-        "INSERT INTO sources (id, name, enabled, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
-        ("test-source", "Test Source", 1, "2024-01-01T00:00:00+00:00", "2024-01-01T00:00:00+00:00"),
-    )
-    conn.commit()
+def test_source_health_history_endpoint(seeded_conn, client):
+    conn = seeded_conn
+    upsert_source(conn, {"id": "test-source", "name": "Test Source", "enabled": True})
     insert_source_health_event(
         conn,
         source_id="test-source",
@@ -1,11 +1,7 @@
-import copy
-
-from sempervigil.config import DEFAULT_CONFIG, set_runtime_config
 from sempervigil.storage import (
     add_watchlist_vendor,
     compute_scope_for_cves,
     get_cve,
-    init_db,
     link_cve_product,
     upsert_cve,
     upsert_product,
@@ -13,22 +9,8 @@ from sempervigil.storage import (
 )
 
 
-def _seed_runtime_config(tmp_path):
-    data_dir = tmp_path / "data"
-    conn = init_db()
-    config = copy.deepcopy(DEFAULT_CONFIG)
-    config["paths"]["data_dir"] = str(data_dir)
-    config["paths"]["output_dir"] = str(tmp_path / "site" / "content" / "posts")
-    config["paths"]["run_reports_dir"] = str(data_dir / "reports")
-    config["publishing"]["json_index_path"] = str(
-        tmp_path / "site" / "static" / "sempervigil" / "index.json"
-    )
-    set_runtime_config(conn, config)
-    return conn
-
-
-def test_watchlist_vendor_marks_cve_in_scope(tmp_path):
-    conn = _seed_runtime_config(tmp_path)
+def test_watchlist_vendor_marks_cve_in_scope(db_conn):
+    conn = db_conn
     cve_id = "CVE-2025-0001"
     upsert_cve(
         conn,
@@ -51,8 +33,8 @@ def test_watchlist_vendor_marks_cve_in_scope(tmp_path):
     link_cve_product(conn, cve_id, product_id)
 
     add_watchlist_vendor(conn, "Microsoft")
-    compute_scope_for_cves(conn, [cve_id], min_cvss=None)
 
+    compute_scope_for_cves(conn, [cve_id], min_cvss=None)
     detail = get_cve(conn, cve_id)
     assert detail["in_scope"] is True
     assert any("matched_vendor:" in reason for reason in detail["scope_reasons"])
@@ -0,0 +1,113 @@
+import logging
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from urllib.error import HTTPError, URLError
+
+import pytest
+
+from sempervigil import worker
+
+
+class _Conn:
+    pass
+
+
+def test_worker_job_types_follow_handler_table():
+    assert worker.WORKER_JOB_TYPES == list(worker._HANDLERS)
+    assert "ingest_source" in worker.WORKER_JOB_TYPES
+    assert "smoke_test" in worker.WORKER_JOB_TYPES
+
+
+def test_run_claimed_job_dispatches_by_type(monkeypatch):
+    calls = []
+
+    def _fake_test_source(conn, config, payload, logger):
+        calls.append(payload)
+        return {"ok": True}
+
+    monkeypatch.setattr(worker, "is_job_canceled", lambda conn, job_id: False)
+    monkeypatch.setattr(worker, "_handle_test_source", _fake_test_source)
+    logger = logging.getLogger("sempervigil.test.dispatch")
+    job = SimpleNamespace(id="job-1", job_type="test_source", payload={"source_id": "a"})
+    monkeypatch.setattr(worker, "_log_job_claimed", lambda conn, job, logger: None)
+
+    assert worker.run_claimed_job(None, None, job, logger) == {"ok": True}
+    assert calls == [{"source_id": "a"}]
+
+    job = SimpleNamespace(id="job-2", job_type="unknown", payload=None)
+    with pytest.raises(ValueError):
+        worker.run_claimed_job(None, None, job, logger)
+
+
+def test_transient_errors_are_requeued_with_backoff(monkeypatch):
+    requeued = []
+
+    def _fake_requeue(conn, job_id, payload, requested_at):
+        requeued.append(payload)
+        return True
+
+    monkeypatch.setattr(worker, "requeue_job", _fake_requeue)
+    logger = logging.getLogger("sempervigil.test.dispatch")
+    job = SimpleNamespace(id="job-1", job_type="ingest_source", payload={"source_id": "a"})
+
+    assert worker._is_transient_error(URLError("timed out"))
+    assert worker._is_transient_error(HTTPError("u", 503, "busy", None, None))
+    assert not worker._is_transient_error(HTTPError("u", 404, "missing", None, None))
+    assert not worker._is_transient_error(ValueError("bad payload"))
+
+    assert worker._requeue_transient(None, job, URLError("timed out"), logger)
+    assert requeued[0]["retry_attempt"] == 1
+    assert requeued[0]["source_id"] == "a"
+    assert "not_before" in requeued[0]
+
+    # fetch_article_content runs its own attempt/backoff, so it is never requeued here.
+    job = SimpleNamespace(id="job-2", job_type="fetch_article_content", payload={"article_id": 1})
+    assert not worker._requeue_transient(None, job, URLError("timed out"), logger)
+    assert len(requeued) == 1
+
+
+def test_transient_error_fails_job_once_retries_run_out(monkeypatch):
+    failed = []
+
+    def _raise_transient(conn, config, job, logger, now=None):
+        raise URLError("timed out")
+
+    def _unexpected_requeue(conn, job_id, payload, requested_at):
+        raise AssertionError("exhausted job should not be requeued")
+
+    monkeypatch.setattr(worker, "is_job_canceled", lambda conn, job_id: False)
+    monkeypatch.setattr(worker, "run_claimed_job", _raise_transient)
+    monkeypatch.setattr(worker, "requeue_job", _unexpected_requeue)
+    monkeypatch.setattr(
+        worker, "fail_job", lambda conn, job_id, error: failed.append((job_id, error))
+    )
+    monkeypatch.setattr(worker, "_job_context_fields", lambda conn, job: {})
+    logger = logging.getLogger("sempervigil.test.dispatch")
+    exhausted = {"source_id": "a", "retry_attempt": len(worker.TRANSIENT_RETRY_BACKOFF)}
+    job = SimpleNamespace(id="job-3", job_type="ingest_source", payload=exhausted)
+
+    assert worker._process_claimed_job(_Conn(), None, job, logger) == 1
+    assert failed == [("job-3", "<urlopen error timed out>")]
+
+
+def test_run_once_reads_job_clock_after_claim(monkeypatch):
+    seen = {}
+
+    def _fake_tick(conn, logger, now=None):
+        seen["tick"] = now
+
+    def _fake_claim(conn, worker_id, allowed_types=None, lock_timeout_seconds=None):
+        seen["claimed"] = datetime.now(tz=timezone.utc)
+        return SimpleNamespace(id="job-4", job_type="ingest_source", payload={"source_id": "a"})
+
+    def _fake_process(conn, config, job, logger, now=None):
+        seen["job"] = now
+        return 0
+
+    monkeypatch.setattr(worker, "_maybe_enqueue_ingest_due_sources", _fake_tick)
+    monkeypatch.setattr(worker, "_maybe_enqueue_cve_sync", _fake_tick)
+    monkeypatch.setattr(worker, "claim_next_job", _fake_claim)
+    monkeypatch.setattr(worker, "_process_claimed_job", _fake_process)
+
+    assert worker.run_once("worker-test") == 0
+    assert seen["tick"] <= seen["claimed"] <= seen["job"]
@@ -0,0 +1,30 @@
+from types import SimpleNamespace
+
+from sempervigil import worker
+
+
+def _config(data_dir, output_dir):
+    return SimpleNamespace(paths=SimpleNamespace(data_dir=str(data_dir), output_dir=str(output_dir)))
+
+
+def test_runtime_dirs_prepared_once_per_paths(tmp_path, monkeypatch):
+    calls = {"dirs": 0, "umask": 0}
+
+    def _fake_dirs(paths):
+        calls["dirs"] += 1
+
+    def _fake_umask():
+        calls["umask"] += 1
+
+    monkeypatch.setattr(worker, "_RUNTIME_DIRS_READY", set())
+    monkeypatch.setattr(worker, "ensure_runtime_dirs", _fake_dirs)
+    monkeypatch.setattr(worker, "set_umask_from_env", _fake_umask)
+
+    config = _config(tmp_path / "data", tmp_path / "site" / "content" / "posts")
+    worker._ensure_runtime_dirs_once(config)
+    worker._ensure_runtime_dirs_once(config)
+    assert calls == {"dirs": 1, "umask": 1}
+
+    moved = _config(tmp_path / "data2", tmp_path / "site" / "content" / "posts")
+    worker._ensure_runtime_dirs_once(moved)
+    assert calls == {"dirs": 2, "umask": 2}
@@ -0,0 +1,70 @@
+import logging
+from types import SimpleNamespace
+
+from sempervigil import worker
+from sempervigil.models import Source
+
+
+class _Conn:
+    pass
+
+
+def _source(source_id: str) -> Source:
+    return Source(
+        id=source_id,
+        name="Source One",
+        enabled=True,
+        base_url="https://example.com",
+        topic_key=None,
+        default_frequency_minutes=60,
+        pause_until=None,
+        paused_reason=None,
+        robots_notes=None,
+    )
+
+
+def test_source_lookups_cached_per_connection(monkeypatch):
+    calls = []
+
+    def _fake_get_source(conn, source_id):
+        calls.append(source_id)
+        return _source(source_id)
+
+    monkeypatch.setattr(worker, "get_source", _fake_get_source)
+
+    conn = _Conn()
+    assert worker._get_source_cached(conn, "source-1").id == "source-1"
+    assert worker._get_source_name_cached(conn, "source-1") == "Source One"
+    assert worker._get_source_name_cached(conn, "") is None
+    assert calls == ["source-1"]
+
+    worker._invalidate_source_cache(conn, "source-1")
+    worker._get_source_cached(conn, "source-1")
+    assert calls == ["source-1", "source-1"]
+
+    worker._get_source_cached(_Conn(), "source-1")
+    assert len(calls) == 3
+
+
+def test_source_cache_cleared_for_each_job(monkeypatch):
+    calls = []
+
+    def _fake_get_source(conn, source_id):
+        calls.append(source_id)
+        return _source(source_id)
+
+    def _fake_run(conn, config, job, logger, now=None):
+        worker._get_source_cached(conn, "source-1")
+        return {"requeued": True}
+
+    monkeypatch.setattr(worker, "get_source", _fake_get_source)
+    monkeypatch.setattr(worker, "is_job_canceled", lambda conn, job_id: False)
+    monkeypatch.setattr(worker, "run_claimed_job", _fake_run)
+    monkeypatch.setattr(worker, "_job_context_fields", lambda conn, job: {})
+
+    conn = _Conn()
+    job = SimpleNamespace(id="job-1", job_type="ingest_source", payload={"source_id": "source-1"})
+    logger = logging.getLogger("sempervigil.test.source_cache")
+    worker._process_claimed_job(conn, None, job, logger)
+    worker._process_claimed_job(conn, None, job, logger)
+    assert calls == ["source-1", "source-1"]